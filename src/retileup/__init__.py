@@ -1,14 +1,26 @@
 """ReTileUp: A modular CLI toolkit for advanced image processing and transformation workflows."""
 
+from typing import TYPE_CHECKING
+
+from ._lazy import attach
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-# Public API
-from .core.config import Config
-from .core.registry import ToolRegistry
-from .core.orchestrator import WorkflowOrchestrator
-from .core.workflow import Workflow, WorkflowStep
+if TYPE_CHECKING:
+    from .core.config import Config
+    from .core.orchestrator import WorkflowOrchestrator
+    from .core.registry import ToolRegistry
+    from .core.workflow import Workflow, WorkflowStep
+
+_LAZY_IMPORTS = {
+    "Config": ".core.config",
+    "ToolRegistry": ".core.registry",
+    "WorkflowOrchestrator": ".core.orchestrator",
+    "Workflow": ".core.workflow",
+    "WorkflowStep": ".core.workflow",
+}
 
 __all__ = [
     "__version__",
@@ -17,4 +29,6 @@ __all__ = [
     "WorkflowOrchestrator",
     "Workflow",
     "WorkflowStep",
-]
\ No newline at end of file
+]
+
+__getattr__ = attach(__name__, _LAZY_IMPORTS)
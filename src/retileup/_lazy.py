@@ -0,0 +1,31 @@
+"""Lazy imports of package attributes (PEP 562)."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def attach(package: str, lazy_imports: Dict[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports attributes on first access.
+
+    Packages use this for their public API so that importing a package does
+    not import all of its submodules, and lightweight entry points (e.g.
+    ``retileup --version``) don't pay for PIL/pydantic imports.
+
+    Args:
+        package: Name of the package (its ``__name__``)
+        lazy_imports: Attribute name -> module, relative to the package
+
+    Returns:
+        Function to assign to the package's ``__getattr__``
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
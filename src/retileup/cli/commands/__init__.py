@@ -1,12 +1,26 @@
 """CLI commands module for ReTileUp."""
 
-from .tile import tile_command
-from .workflow import workflow_command
-from .utils import list_tools_command, validate_command
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+if TYPE_CHECKING:
+    from .tile import tile_command
+    from .utils import list_tools_command, validate_command
+    from .workflow import workflow_command
+
+_LAZY_IMPORTS = {
+    "tile_command": ".tile",
+    "workflow_command": ".workflow",
+    "list_tools_command": ".utils",
+    "validate_command": ".utils",
+}
 
 __all__ = [
     "tile_command",
     "workflow_command",
     "list_tools_command",
     "validate_command",
-]
\ No newline at end of file
+]
+
+__getattr__ = attach(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,17 @@
+"""Hidden development commands for ReTileUp CLI."""
+
+from retileup import __version__
+from retileup.cli.main import get_console
+
+
+def hello() -> None:
+    """Test command to verify CLI is working."""
+    console = get_console()
+    console.print("🎨 [bold green]ReTileUp CLI is working![/bold green]")
+    console.print(f"Version: [cyan]{__version__}[/cyan]")
+    console.print("Ready for image processing workflows!")
+
+
+def error_test() -> None:
+    """Test error handling (hidden command for development)."""
+    raise RuntimeError("This is a test error to verify error handling works.")
@@ -6,8 +6,6 @@ from typing import Optional, Set
 import typer
 from rich.console import Console
 
-from ...core.registry import ToolRegistry
-from ...tools.batch_renamer import BatchRenamerConfig
 from ..main import global_state
 
 console = Console()
@@ -142,6 +140,8 @@ def batch_rename_command(
                 supported_extensions.add(ext.lower())
 
         # Create configuration
+        from ...tools.batch_renamer import BatchRenamerConfig
+
         config = BatchRenamerConfig(
             input_path=input_dir,
             output_dir=output_dir,
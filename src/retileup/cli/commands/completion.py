@@ -0,0 +1,39 @@
+"""Shell completion installation command for ReTileUp CLI."""
+
+import typer
+
+
+def install_completion(
+    ctx: typer.Context,
+    shell: str = typer.Option(
+        "auto",
+        "--shell",
+        help="Shell type: bash, zsh, fish, or auto-detect",
+        metavar="SHELL",
+    ),
+    show_path: bool = typer.Option(
+        False,
+        "--show-path",
+        help="Show the completion script path instead of installing",
+    ),
+) -> None:
+    """Install shell completion for ReTileUp.
+
+    [bold]Examples:[/bold]
+        # Auto-detect shell and install
+        retileup install-completion
+
+        # Install for specific shell
+        retileup install-completion --shell bash
+
+        # Show completion script path
+        retileup install-completion --show-path
+
+    [bold]Supported Shells:[/bold]
+        • [cyan]bash[/cyan] - Bash shell completion
+        • [cyan]zsh[/cyan] - Zsh shell completion
+        • [cyan]fish[/cyan] - Fish shell completion
+        • [cyan]auto[/cyan] - Auto-detect current shell
+    """
+    from retileup.cli.completion import install_completion_command
+    install_completion_command(ctx, shell, show_path)
@@ -9,9 +9,7 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 
-from retileup.core.registry import get_global_registry
 from retileup.core.exceptions import ValidationError, ProcessingError
-from retileup.tools.tiling import TilingConfig
 
 
 def parse_coordinates(coords_str: str) -> List[Tuple[int, int]]:
@@ -218,7 +216,10 @@ def tile_command(
             console.print(coord_table)
             console.print()
 
-        # Get tiling tool from registry
+        # Get tiling tool from registry (imported here to keep CLI startup light)
+        from retileup.core.registry import get_global_registry
+        from retileup.tools.tiling import TilingConfig
+
         registry = get_global_registry()
         tiling_tool = registry.create_tool("tile")
 
@@ -11,7 +11,6 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
-from retileup.core.registry import get_global_registry
 from retileup.core.exceptions import ValidationError
 
 
@@ -167,6 +166,8 @@ def list_tools_command(
 
     try:
         # Get registry and tool information
+        from retileup.core.registry import get_global_registry
+
         registry = get_global_registry()
         tools_info = registry.list_tools(include_metadata=True)  # Always get metadata for CLI display
 
@@ -413,6 +414,8 @@ def validate_command(
 
             # Strict validation
             if strict and not workflow_errors:
+                from retileup.core.registry import get_global_registry
+
                 registry = get_global_registry()
 
                 # Check tool availability
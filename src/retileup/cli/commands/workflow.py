@@ -1,8 +1,11 @@
 """Workflow command implementation for ReTileUp CLI."""
 
-import asyncio
+import bisect
+import contextlib
+import functools
+import time
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, List, Tuple
 
 import typer
 import yaml
@@ -11,34 +14,79 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 from rich.table import Table
 from rich.panel import Panel
 
-from retileup.core.registry import get_global_registry
-from retileup.core.orchestrator import WorkflowOrchestrator
-from retileup.core.config import Config
 from retileup.core.exceptions import ValidationError, ProcessingError, WorkflowError
 
+if TYPE_CHECKING:
+    from retileup.core.orchestrator import WorkflowOrchestrator
+    from retileup.core.workflow import Workflow
+    from retileup.tools.base import ToolResult
+
+
+@functools.lru_cache(maxsize=None)
+def _workflow_config_locations() -> Tuple[Path, ...]:
+    """Get workflow configuration file locations in search order.
+
+    Built once per process; call ``_workflow_config_locations.cache_clear()``
+    if ``$HOME`` changes (e.g. in tests).
+
+    Returns:
+        Tuple of candidate configuration file paths
+    """
+    home = Path.home()
+    return (
+        Path("./retileup.yaml"),
+        Path("./workflows.yaml"),
+        home / ".retileup.yaml",
+        home / ".config" / "retileup" / "config.yaml",
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_sorted_workflow_names(
+    config_path: str, _mtime_ns: int, _size: int
+) -> Optional[Tuple[str, ...]]:
+    """Load workflow names from a configuration file, sorted for prefix search.
+
+    Results are cached per (path, mtime, size) so repeated completion
+    requests do not re-parse unchanged YAML files.
+
+    Args:
+        config_path: Path to configuration file
+        _mtime_ns: Modification time of the file, only used as cache key
+        _size: Size of the file, only used as cache key
+
+    Returns:
+        Sorted tuple of workflow names, or None if no workflows are defined
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    if config and "workflows" in config:
+        return tuple(sorted(config["workflows"].keys()))
+    return None
+
 
 def complete_workflow_names(incomplete: str) -> List[str]:
     """Auto-complete workflow names from configuration files."""
     try:
         # Try to find and load configuration file
-        config_locations = [
-            Path("./retileup.yaml"),
-            Path("./workflows.yaml"),
-            Path.home() / ".retileup.yaml",
-            Path.home() / ".config" / "retileup" / "config.yaml",
-        ]
-
-        for config_path in config_locations:
-            if config_path.exists():
-                try:
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        config = yaml.safe_load(f)
+        for config_path in _workflow_config_locations():
+            try:
+                stat = config_path.stat()
+                workflow_names = _load_sorted_workflow_names(
+                    str(config_path), stat.st_mtime_ns, stat.st_size
+                )
+            except Exception:
+                continue
 
-                    if config and "workflows" in config:
-                        workflow_names = list(config["workflows"].keys())
-                        return [name for name in workflow_names if name.startswith(incomplete)]
-                except Exception:
-                    continue
+            if workflow_names is not None:
+                # Names sharing the prefix form a contiguous range of the sorted tuple
+                lo = bisect.bisect_left(workflow_names, incomplete)
+                if not incomplete:
+                    return list(workflow_names[lo:])
+                upper = incomplete[:-1] + chr(ord(incomplete[-1]) + 1)
+                hi = bisect.bisect_left(workflow_names, upper, lo)
+                return list(workflow_names[lo:hi])
 
         return []
     except Exception:
@@ -60,14 +108,7 @@ def load_workflow_config(config_file: Optional[Path]) -> dict:
     """
     if config_file is None:
         # Try to auto-detect config files
-        config_locations = [
-            Path("./retileup.yaml"),
-            Path("./workflows.yaml"),
-            Path.home() / ".retileup.yaml",
-            Path.home() / ".config" / "retileup" / "config.yaml",
-        ]
-
-        for config_path in config_locations:
+        for config_path in _workflow_config_locations():
             if config_path.exists():
                 config_file = config_path
                 break
@@ -77,11 +118,8 @@ def load_workflow_config(config_file: Optional[Path]) -> dict:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
-    try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"Invalid YAML in config file {config_file}: {e}")
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
 
 
 def validate_workflow_exists(config: dict, workflow_name: str) -> dict:
@@ -158,6 +196,131 @@ def collect_input_files(input_path: Path) -> list[Path]:
         raise ValueError(f"Input path does not exist: {input_path}")
 
 
+def build_workflow(workflow_name: str, workflow_config: dict) -> "Workflow":
+    """Build a workflow from its configuration file entry.
+
+    Steps name their tool with ``tool`` and its parameters with ``config``,
+    as in the configuration file format; ``tool_name`` and ``parameters``
+    are accepted as well.
+
+    Args:
+        workflow_name: Name of the workflow in the configuration file
+        workflow_config: Workflow configuration dictionary
+
+    Returns:
+        Workflow instance
+
+    Raises:
+        ValueError: If the configuration does not describe a valid workflow
+    """
+    from retileup.core.workflow import Workflow
+
+    steps = []
+    for i, step in enumerate(workflow_config["steps"], 1):
+        if not isinstance(step, dict):
+            raise ValueError(f"Step {i} of workflow '{workflow_name}' must be a dictionary")
+        step_data = {
+            key: value for key, value in step.items()
+            if key not in ("tool", "config")
+        }
+        step_data.setdefault("name", f"step-{i}")
+        step_data.setdefault("tool_name", step.get("tool"))
+        step_data.setdefault("parameters", step.get("config") or {})
+        steps.append(step_data)
+
+    data: Dict[str, Any] = {
+        key: value for key, value in workflow_config.items() if key != "steps"
+    }
+    data.setdefault("name", workflow_name)
+    data["steps"] = steps
+    return Workflow.from_dict(data)
+
+
+def _execute_workflow_on_file(
+    orchestrator: "WorkflowOrchestrator",
+    workflow: "Workflow",
+    input_file: Path,
+    output: Path,
+) -> "ToolResult":
+    """Execute a workflow on a single input file.
+
+    The file and output directory are passed to every step as the global
+    ``input_path`` and ``output_dir`` parameters.
+
+    Args:
+        orchestrator: Workflow orchestrator
+        workflow: Workflow to execute
+        input_file: Input image file
+        output: Output directory
+
+    Returns:
+        Result for the file, with the file path in its metadata
+    """
+    from PIL import Image
+
+    from retileup.tools.base import ToolResult
+
+    start_time = time.perf_counter()
+    metadata = {"input_file": str(input_file)}
+    file_workflow = workflow.model_copy(update={
+        "global_parameters": {
+            **workflow.global_parameters,
+            "input_path": input_file,
+            "output_dir": output,
+        }
+    })
+
+    try:
+        with Image.open(input_file) as image:
+            step_results = orchestrator.execute_workflow(file_workflow, image, validate=False)
+    except Exception as e:
+        return ToolResult(
+            success=False,
+            message=str(e),
+            metadata=metadata,
+            execution_time=time.perf_counter() - start_time,
+        )
+
+    failed = next((r for r in step_results if not r.success), None)
+    if failed is not None:
+        message = f"Step '{failed.step.name}' failed: {failed.error}"
+    else:
+        message = f"Completed {len(step_results)} steps"
+    return ToolResult(
+        success=failed is None,
+        message=message,
+        metadata=metadata,
+        execution_time=time.perf_counter() - start_time,
+    )
+
+
+def _execute_workflow_on_files(
+    orchestrator: "WorkflowOrchestrator",
+    workflow: "Workflow",
+    input_files: List[Path],
+    output: Path,
+    progress_cb: Optional[Callable[[int], None]] = None,
+) -> List["ToolResult"]:
+    """Execute a workflow over input files, one file at a time.
+
+    Args:
+        orchestrator: Workflow orchestrator
+        workflow: Workflow to execute
+        input_files: Input files to process
+        output: Output directory
+        progress_cb: Optional callback receiving the number of completed files
+
+    Returns:
+        List of per-file workflow results
+    """
+    results = []
+    for i, input_file in enumerate(input_files, 1):
+        results.append(_execute_workflow_on_file(orchestrator, workflow, input_file, output))
+        if progress_cb is not None:
+            progress_cb(i)
+    return results
+
+
 def workflow_command(
     ctx: typer.Context,
     workflow_name: str = typer.Argument(
@@ -196,7 +359,7 @@ def workflow_command(
     parallel: int = typer.Option(
         4,
         "--parallel",
-        help="Maximum parallel jobs",
+        help="Maximum worker threads for parallel workflow steps",
         min=1,
         max=16,
     ),
@@ -233,7 +396,7 @@ def workflow_command(
     """
     # Get CLI context
     cli_context = ctx.obj or {}
-    console: Console = cli_context.get("console", Console())
+    console: Console = cli_context.get("console") or Console()
     verbose: bool = cli_context.get("verbose", False)
     quiet: bool = cli_context.get("quiet", False)
 
@@ -276,37 +439,48 @@ def workflow_command(
 
             console.print()
 
-        # Show workflow steps in verbose mode
-        if verbose and not quiet:
-            steps_table = Table(title="Workflow Steps")
-            steps_table.add_column("Step", style="cyan")
-            steps_table.add_column("Tool", style="magenta")
-            steps_table.add_column("Description", style="dim")
+            if verbose:
+                # Show workflow steps
+                steps_table = Table(title="Workflow Steps")
+                steps_table.add_column("Step", style="cyan")
+                steps_table.add_column("Tool", style="magenta")
+                steps_table.add_column("Description", style="dim")
 
-            for i, step in enumerate(workflow_config["steps"], 1):
-                tool_name = step.get("tool", "unknown")
-                description = step.get("description", "No description")
-                steps_table.add_row(str(i), tool_name, description)
+                for i, step in enumerate(workflow_config["steps"], 1):
+                    tool_name = step.get("tool", "unknown")
+                    description = step.get("description", "No description")
+                    steps_table.add_row(str(i), tool_name, description)
 
-            console.print(steps_table)
-            console.print()
+                console.print(steps_table)
+                console.print()
 
-        # Show input files in verbose mode
-        if verbose and not quiet and len(input_files) <= 20:
-            files_panel = Panel(
-                "\\n".join([f"• {f}" for f in input_files]),
-                title=f"Input Files ({len(input_files)})",
-                border_style="dim"
-            )
-            console.print(files_panel)
-            console.print()
+                # Show input files
+                if len(input_files) <= 20:
+                    files_panel = Panel(
+                        "\n".join(f"• {f}" for f in input_files),
+                        title=f"Input Files ({len(input_files)})",
+                        border_style="dim"
+                    )
+                    console.print(files_panel)
+                    console.print()
+
+        # Create workflow orchestrator (imported here to keep CLI startup light)
+        from retileup.core.config import Config
+        from retileup.core.orchestrator import WorkflowOrchestrator
+        from retileup.core.registry import get_global_registry
 
-        # Create workflow orchestrator
         registry = get_global_registry()
-        orchestrator = WorkflowOrchestrator(registry)
+        orchestrator_config = Config.load_default()
+        orchestrator_config.performance.max_workers = parallel
+        orchestrator = WorkflowOrchestrator(registry, orchestrator_config)
 
         # Validate workflow configuration
-        validation_errors = orchestrator.validate_workflow(workflow_config)
+        try:
+            workflow = build_workflow(workflow_name, workflow_config)
+        except ValueError as e:
+            validation_errors = [str(e)]
+        else:
+            validation_errors = workflow.validate_workflow(registry)
         if validation_errors:
             console.print("[red]Workflow validation errors:[/red]")
             for error in validation_errors:
@@ -318,61 +492,41 @@ def workflow_command(
             console.print("[yellow]Dry run completed - no files were processed[/yellow]")
             return
 
-        # Execute workflow
-        if not quiet:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console,
-            ) as progress:
+        # Execute workflow (progress bar only when not quiet)
+        progress_cm = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) if not quiet else contextlib.nullcontext()
+
+        with progress_cm as progress:
+            progress_cb: Optional[Callable[[int], None]] = None
+            if progress is not None:
                 task = progress.add_task(
                     f"Executing workflow on {len(input_files)} files...",
                     total=len(input_files)
                 )
 
-                # Run workflow (asyncio support for future parallel processing)
-                try:
-                    results = asyncio.run(
-                        orchestrator.execute_workflow(
-                            workflow_config,
-                            input_files,
-                            output,
-                            parallel=(parallel > 1)
-                        )
-                    )
-                except Exception as e:
-                    # Fallback to synchronous execution if asyncio fails
-                    console.print("[yellow]Note:[/yellow] Falling back to synchronous execution")
-                    results = []
-                    for i, input_file in enumerate(input_files):
-                        result = orchestrator._execute_single_workflow(
-                            workflow_config, input_file, output
-                        )
-                        results.append(result)
-                        progress.update(task, completed=i + 1)
-
-                progress.update(task, completed=len(input_files))
-        else:
-            # Execute without progress bar in quiet mode
+                def update_progress(completed: int) -> None:
+                    progress.update(task, completed=completed)
+
+                progress_cb = update_progress
+
             try:
-                results = asyncio.run(
-                    orchestrator.execute_workflow(
-                        workflow_config,
-                        input_files,
-                        output,
-                        parallel=(parallel > 1)
-                    )
+                results = _execute_workflow_on_files(
+                    orchestrator,
+                    workflow,
+                    input_files,
+                    output,
+                    progress_cb=progress_cb,
                 )
-            except Exception:
-                # Fallback to synchronous execution
-                results = []
-                for input_file in input_files:
-                    result = orchestrator._execute_single_workflow(
-                        workflow_config, input_file, output
-                    )
-                    results.append(result)
+            finally:
+                orchestrator.cleanup()
+
+            if progress_cb is not None:
+                progress_cb(len(input_files))
 
         # Process results
         successful_results = [r for r in results if r.success]
@@ -387,7 +541,7 @@ def workflow_command(
 
             # Show performance metrics if verbose
             if verbose and successful_results:
-                total_time = sum(r.execution_time for r in results)
+                total_time = sum(r.execution_time or 0.0 for r in results)
                 avg_time = total_time / len(results) if results else 0
 
                 metrics_table = Table(title="Performance Metrics")
@@ -405,7 +559,7 @@ def workflow_command(
 
             # Show failed files if any
             if failed_results and verbose:
-                console.print("\\n[red]Failed files:[/red]")
+                console.print("\n[red]Failed files:[/red]")
                 for result in failed_results[:5]:  # Show first 5 failures
                     console.print(f"  [dim]•[/dim] {result.metadata.get('input_file', 'Unknown')}: {result.message}")
 
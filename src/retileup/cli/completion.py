@@ -223,11 +223,11 @@ def install_completion_command(
 
                 # Add completion line to shell config
                 with open(completion_dir, 'a', encoding='utf-8') as f:
-                    f.write(f"\\n# ReTileUp completion\\n{completion_line}\\n")
+                    f.write(f"\n# ReTileUp completion\n{completion_line}\n")
 
                 console.print(f"[green]✓[/green] Completion installed for {shell}")
                 console.print(f"[dim]Added to: {completion_dir}[/dim]")
-                console.print("\\n[yellow]Note:[/yellow] Restart your shell or run:")
+                console.print("\n[yellow]Note:[/yellow] Restart your shell or run:")
                 console.print(f"[cyan]source {completion_dir}[/cyan]")
 
             else:
@@ -235,7 +235,7 @@ def install_completion_command(
 
         except Exception as e:
             console.print(f"[red]Failed to install completion:[/red] {e}")
-            console.print("\\n[bold]Manual installation:[/bold]")
+            console.print("\n[bold]Manual installation:[/bold]")
             console.print(f"Add this line to your {shell} configuration file:")
 
             if shell == "bash":
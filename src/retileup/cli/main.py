@@ -1,25 +1,96 @@
 """Main CLI entry point for ReTileUp."""
 
+import functools
+import importlib
+import os
 import sys
+from difflib import get_close_matches
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import typer
 from rich.console import Console
-from rich.traceback import install
+from typer.core import TyperGroup
+from typer.models import CommandInfo
 
 from retileup import __version__
 from retileup.core.exceptions import RetileupError
 
-# Install rich traceback handler for better error formatting
-install()
 
-# Create console for rich output
-console = Console()
+@functools.lru_cache(maxsize=None)
+def get_console() -> Console:
+    """Get the shared console for rich output, creating it on first use."""
+    return Console()
+
+
+def __getattr__(name: str) -> Any:
+    """Expose the shared console as ``retileup.cli.main.console``."""
+    if name == "console":
+        console = get_console()
+        globals()["console"] = console
+        return console
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Subcommands resolved on first use: (command name, "module:attribute")
+# Keeping these out of the import path means e.g. ``retileup --version`` or
+# ``retileup tile ...`` never import the modules of the other commands.
+_LAZY_COMMANDS = (
+    ("tile", "retileup.cli.commands.tile:tile_command"),
+    ("workflow", "retileup.cli.commands.workflow:workflow_command"),
+    ("list-tools", "retileup.cli.commands.utils:list_tools_command"),
+    ("validate", "retileup.cli.commands.utils:validate_command"),
+    ("batch-rename", "retileup.cli.commands.batch_rename:batch_rename_command"),
+    ("install-completion", "retileup.cli.commands.completion:install_completion"),
+)
+# Hidden development commands: resolvable by name, never listed or suggested
+_HIDDEN_LAZY_COMMANDS = (
+    ("hello", "retileup.cli.commands._dev:hello"),
+    ("_error_test", "retileup.cli.commands._dev:error_test"),
+)
+_VISIBLE_COMMAND_NAMES = frozenset(name for name, _ in _LAZY_COMMANDS)
+_LAZY_COMMAND_SPECS: Dict[str, str] = dict(_LAZY_COMMANDS + _HIDDEN_LAZY_COMMANDS)
+
+
+class LazyCommandGroup(TyperGroup):
+    """Typer group that imports subcommand modules only when they are used."""
+
+    def list_commands(self, ctx: Any) -> List[str]:
+        """List lazy subcommands first, followed by the eagerly registered ones."""
+        eager = [name for name in super().list_commands(ctx) if name not in _LAZY_COMMAND_SPECS]
+        return [name for name, _ in _LAZY_COMMANDS] + eager
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Get a subcommand, importing and building it on first access."""
+        command = super().get_command(ctx, cmd_name)
+        spec = _LAZY_COMMAND_SPECS.get(cmd_name)
+        if command is None and spec is not None:
+            module_name, attr_name = spec.split(":")
+            callback = getattr(importlib.import_module(module_name), attr_name)
+            command = typer.main.get_command_from_info(
+                CommandInfo(
+                    name=cmd_name,
+                    callback=callback,
+                    hidden=cmd_name not in _VISIBLE_COMMAND_NAMES,
+                ),
+                pretty_exceptions_short=app.pretty_exceptions_short,
+                rich_markup_mode=self.rich_markup_mode,
+            )
+            self.add_command(command, cmd_name)
+        return command
+
+    def resolve_command(self, ctx: Any, args: List[str]) -> Any:
+        """Resolve a subcommand, letting typo suggestions include lazy commands."""
+        if args and args[0] not in self.commands and args[0] not in _LAZY_COMMAND_SPECS:
+            for name in get_close_matches(args[0], list(_VISIBLE_COMMAND_NAMES)):
+                self.get_command(ctx, name)
+        return super().resolve_command(ctx, args)
+
 
 # Create main Typer app with global options
 app = typer.Typer(
     name="retileup",
+    cls=LazyCommandGroup,
     help="A modular CLI toolkit for advanced image processing and transformation workflows",
     add_completion=True,
     rich_markup_mode="rich",
@@ -30,6 +101,9 @@ app = typer.Typer(
 # Global state for CLI options
 class GlobalState:
     """Global state for CLI options."""
+
+    __slots__ = ("config_file", "quiet", "verbose")
+
     def __init__(self):
         self.config_file: Optional[Path] = None
         self.verbose: bool = False
@@ -47,58 +121,68 @@ global_state = GlobalState()
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
-        console.print(f"[bold green]ReTileUp[/bold green] version [cyan]{__version__}[/cyan]")
+        get_console().print(f"[bold green]ReTileUp[/bold green] version [cyan]{__version__}[/cyan]")
         raise typer.Exit()
 
 
-def config_callback(ctx: typer.Context, param: typer.CallbackParam, value: Optional[str]) -> Optional[Path]:
-    """Handle config file option with auto-detection."""
-    if value is None:
-        # Auto-detect configuration file
-        config_locations = [
-            Path("./retileup.yaml"),
-            Path.home() / ".retileup.yaml",
-            Path.home() / ".config" / "retileup" / "config.yaml",
-        ]
-
-        for config_path in config_locations:
-            if config_path.exists():
-                global_state.config_file = config_path
-                if global_state.verbose:
-                    console.print(f"[dim]Using config file: {config_path}[/dim]")
-                return config_path
-        return None
-
-    config_path = Path(value)
-    if not config_path.exists():
-        console.print(f"[red]Error:[/red] Configuration file not found: {config_path}")
-        raise typer.Exit(1)
+def _config_candidates() -> Iterator[Path]:
+    """Yield auto-detected configuration file locations in priority order."""
+    yield Path("./retileup.yaml")
+    home = Path.home()
+    yield home / ".retileup.yaml"
+    yield home / ".config" / "retileup" / "config.yaml"
 
-    global_state.config_file = config_path
-    if global_state.verbose:
-        console.print(f"[dim]Using config file: {config_path}[/dim]")
-    return config_path
 
+def _is_listed_file(path: Path) -> bool:
+    """Check whether ``path`` is a file by listing its parent directory.
 
-def verbose_callback(ctx: typer.Context, param: typer.CallbackParam, value: bool) -> bool:
-    """Handle verbose option."""
-    global_state.verbose = value
-    return value
+    Uses ``os.scandir`` entry types instead of a per-candidate ``stat``,
+    which is cheaper when (as is usual) the candidate does not exist.
+    """
+    try:
+        with os.scandir(path.parent) as entries:
+            return any(entry.name == path.name and entry.is_file() for entry in entries)
+    except OSError:
+        return False
 
 
-def quiet_callback(ctx: typer.Context, param: typer.CallbackParam, value: bool) -> bool:
-    """Handle quiet option."""
-    global_state.quiet = value
-    if value and global_state.verbose:
-        console.print("[yellow]Warning:[/yellow] Both --verbose and --quiet specified. Quiet mode takes precedence.")
-        global_state.verbose = False
-    return value
+@functools.lru_cache(maxsize=None)
+def _find_config(cwd: str) -> Optional[Path]:
+    """Find the first existing auto-detected configuration file.
+
+    Candidates are generated lazily, so later locations are not even built
+    once an earlier one matches. Results are cached per working directory
+    for the lifetime of the process.
+
+    Args:
+        cwd: Current working directory (cache key for relative candidates)
+
+    Returns:
+        Path to the configuration file, or None if none was found
+    """
+    return next(
+        (candidate for candidate in _config_candidates() if _is_listed_file(candidate)),
+        None,
+    )
+
+
+def config_callback(ctx: typer.Context, param: typer.CallbackParam, value: Optional[Path]) -> Optional[Path]:
+    """Handle config file option with auto-detection.
+
+    Only resolves the path; existence of an explicit path is checked (and
+    reported) in main() so that option parsing never writes to the console.
+    """
+    if value is None:
+        # Auto-detect configuration file
+        return _find_config(os.getcwd())
+
+    return Path(value)
 
 
 @app.callback()
 def main(
     ctx: typer.Context,
-    config: Optional[str] = typer.Option(
+    config: Optional[Path] = typer.Option(
         None,
         "--config",
         "-c",
@@ -110,14 +194,12 @@ def main(
         False,
         "--verbose",
         "-v",
-        callback=verbose_callback,
         help="Enable verbose output",
     ),
     quiet: bool = typer.Option(
         False,
         "--quiet",
         "-q",
-        callback=quiet_callback,
         help="Suppress non-error output",
     ),
     version: Optional[bool] = typer.Option(
@@ -141,6 +223,24 @@ def main(
         Use [cyan]--verbose[/cyan] for detailed output
         Use [cyan]--quiet[/cyan] to suppress non-error messages
     """
+    console = get_console()
+
+    if config is not None and not config.exists():
+        console.print(f"[red]Error:[/red] Configuration file not found: {config}")
+        raise typer.Exit(1)
+
+    # Resolve global options once all of them have been parsed
+    if verbose and quiet:
+        console.print("[yellow]Warning:[/yellow] Both --verbose and --quiet specified. Quiet mode takes precedence.")
+        verbose = False
+
+    global_state.config_file = config
+    global_state.verbose = verbose
+    global_state.quiet = quiet
+
+    if config is not None and verbose:
+        console.print(f"[dim]Using config file: {config}[/dim]")
+
     # Store the context for use in commands
     ctx.obj = {
         "config_file": global_state.config_file,
@@ -150,86 +250,14 @@ def main(
     }
 
 
-# Import and register command modules
+# Command modules are registered lazily through _LAZY_COMMANDS above.
 # Note: Commands are registered as individual commands, not sub-apps
 # This allows for the flat command structure specified in the API
 
-try:
-    from .commands.tile import tile_command
-    from .commands.workflow import workflow_command
-    from .commands.utils import list_tools_command, validate_command
-    from .commands.batch_rename import batch_rename_command
-
-    # Register commands directly
-    app.command(name="tile")(tile_command)
-    app.command(name="workflow")(workflow_command)
-    app.command(name="list-tools")(list_tools_command)
-    app.command(name="validate")(validate_command)
-    app.command(name="batch-rename")(batch_rename_command)
-
-except ImportError as e:
-    # Commands not yet implemented - will be created
-    if global_state.verbose:
-        console.print(f"[dim]Command modules not yet available: {e}[/dim]")
-    pass
-
-
-# Shell completion installation
-@app.command()
-def install_completion(
-    ctx: typer.Context,
-    shell: str = typer.Option(
-        "auto",
-        "--shell",
-        help="Shell type: bash, zsh, fish, or auto-detect",
-        metavar="SHELL",
-    ),
-    show_path: bool = typer.Option(
-        False,
-        "--show-path",
-        help="Show the completion script path instead of installing",
-    ),
-) -> None:
-    """Install shell completion for ReTileUp.
-
-    [bold]Examples:[/bold]
-        # Auto-detect shell and install
-        retileup install-completion
-
-        # Install for specific shell
-        retileup install-completion --shell bash
-
-        # Show completion script path
-        retileup install-completion --show-path
-
-    [bold]Supported Shells:[/bold]
-        • [cyan]bash[/cyan] - Bash shell completion
-        • [cyan]zsh[/cyan] - Zsh shell completion
-        • [cyan]fish[/cyan] - Fish shell completion
-        • [cyan]auto[/cyan] - Auto-detect current shell
-    """
-    from .completion import install_completion_command
-    install_completion_command(ctx, shell, show_path)
-
-
-# Test command for development
-@app.command(hidden=True)
-def hello() -> None:
-    """Test command to verify CLI is working."""
-    console.print("🎨 [bold green]ReTileUp CLI is working![/bold green]")
-    console.print(f"Version: [cyan]{__version__}[/cyan]")
-    console.print("Ready for image processing workflows!")
-
-
-# Error handling
-@app.command(hidden=True)
-def _error_test() -> None:
-    """Test error handling (hidden command for development)."""
-    raise RuntimeError("This is a test error to verify error handling works.")
-
 
 def handle_exception(e: Exception) -> int:
     """Handle exceptions and return appropriate exit codes."""
+    console = get_console()
     if isinstance(e, RetileupError):
         if not global_state.quiet:
             console.print(f"[red]Error:[/red] {e}")
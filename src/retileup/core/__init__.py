@@ -1,9 +1,22 @@
 """Core functionality module for ReTileUp."""
 
-from .config import Config
-from .orchestrator import WorkflowOrchestrator
-from .registry import ToolRegistry
-from .workflow import Workflow, WorkflowStep
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .orchestrator import WorkflowOrchestrator
+    from .registry import ToolRegistry
+    from .workflow import Workflow, WorkflowStep
+
+_LAZY_IMPORTS = {
+    "Config": ".config",
+    "ToolRegistry": ".registry",
+    "WorkflowOrchestrator": ".orchestrator",
+    "Workflow": ".workflow",
+    "WorkflowStep": ".workflow",
+}
 
 __all__ = [
     "Config",
@@ -11,4 +24,6 @@ __all__ = [
     "WorkflowOrchestrator",
     "Workflow",
     "WorkflowStep",
-]
\ No newline at end of file
+]
+
+__getattr__ = attach(__name__, _LAZY_IMPORTS)
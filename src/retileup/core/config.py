@@ -2,11 +2,45 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+_TRUE = frozenset({"true", "1", "yes", "on"})
+
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean flag."""
+    return value.lower() in _TRUE
+
+
+# Environment variable -> (config section or None for top level, field, converter)
+_ENV_MAP: Tuple[Tuple[str, Optional[str], str, Callable[[str], Any]], ...] = (
+    ("RETILEUP_DEBUG", None, "debug", _to_bool),
+    ("RETILEUP_LOG_LEVEL", "logging", "level", str),
+    ("RETILEUP_LOG_FILE", "logging", "file", Path),
+    ("RETILEUP_MAX_WORKERS", "performance", "max_workers", int),
+    ("RETILEUP_CHUNK_SIZE", "performance", "chunk_size", int),
+    ("RETILEUP_MEMORY_LIMIT", "performance", "memory_limit", int),
+    ("RETILEUP_OUTPUT_DIR", "output", "directory", Path),
+    ("RETILEUP_OUTPUT_FORMAT", "output", "format", str),
+    ("RETILEUP_OUTPUT_QUALITY", "output", "quality", int),
+    ("RETILEUP_OVERWRITE", "output", "overwrite", _to_bool),
+)
+_ENV_KEYS = frozenset(env_var for env_var, _, _, _ in _ENV_MAP)
+
+# Loaded configurations keyed by absolute path -> (mtime_ns, size, config)
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, "Config"]] = {}
+
 
 class LoggingConfig(BaseModel):
     """Logging configuration."""
@@ -72,58 +106,56 @@ class Config(BaseModel):
 
     @classmethod
     def load_from_file(cls, config_path: Union[str, Path]) -> "Config":
-        """Load configuration from a YAML file."""
-        config_path = Path(config_path)
+        """Load configuration from a YAML file.
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        Parsed configurations are cached per file and reused while the file's
+        modification time and size are unchanged. Each call returns an
+        independent copy, so callers may mutate the result freely.
+        """
+        config_path = Path(config_path)
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+        cache_key = config_path.absolute()
+        cached = _CONFIG_CACHE.get(cache_key)
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+            and type(cached[2]) is cls
+        ):
+            # The cached instance is already validated; a deep copy skips
+            # validation and is cheaper than model_construct() for this model,
+            # while keeping the shared instance safe from caller mutation.
+            return cached[2].model_copy(deep=True)
+
+        # Read in one call and let libyaml tokenize the whole buffer
+        config_data = yaml.load(config_path.read_bytes(), Loader=_SafeLoader) or {}
+
+        config = cls(**config_data)
+        _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+        return config.model_copy(deep=True)
 
-        return cls(**config_data)
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cache of configurations loaded from files."""
+        _CONFIG_CACHE.clear()
 
     @classmethod
     def load_from_env(cls) -> "Config":
         """Load configuration from environment variables."""
+        env = os.environ
         config_data: Dict[str, Any] = {}
 
-        # Check for debug mode
-        if os.getenv("RETILEUP_DEBUG"):
-            config_data["debug"] = os.getenv("RETILEUP_DEBUG").lower() in ("true", "1", "yes")
-
-        # Logging configuration
-        logging_config: Dict[str, Any] = {}
-        if log_level := os.getenv("RETILEUP_LOG_LEVEL"):
-            logging_config["level"] = log_level
-        if log_file := os.getenv("RETILEUP_LOG_FILE"):
-            logging_config["file"] = Path(log_file)
-        if logging_config:
-            config_data["logging"] = logging_config
-
-        # Performance configuration
-        performance_config: Dict[str, Any] = {}
-        if max_workers := os.getenv("RETILEUP_MAX_WORKERS"):
-            performance_config["max_workers"] = int(max_workers)
-        if chunk_size := os.getenv("RETILEUP_CHUNK_SIZE"):
-            performance_config["chunk_size"] = int(chunk_size)
-        if memory_limit := os.getenv("RETILEUP_MEMORY_LIMIT"):
-            performance_config["memory_limit"] = int(memory_limit)
-        if performance_config:
-            config_data["performance"] = performance_config
-
-        # Output configuration
-        output_config: Dict[str, Any] = {}
-        if output_dir := os.getenv("RETILEUP_OUTPUT_DIR"):
-            output_config["directory"] = Path(output_dir)
-        if output_format := os.getenv("RETILEUP_OUTPUT_FORMAT"):
-            output_config["format"] = output_format
-        if output_quality := os.getenv("RETILEUP_OUTPUT_QUALITY"):
-            output_config["quality"] = int(output_quality)
-        if overwrite := os.getenv("RETILEUP_OVERWRITE"):
-            output_config["overwrite"] = overwrite.lower() in ("true", "1", "yes")
-        if output_config:
-            config_data["output"] = output_config
+        for env_var, section, field, convert in _ENV_MAP:
+            value = env.get(env_var)
+            if not value:
+                continue
+            target = config_data if section is None else config_data.setdefault(section, {})
+            target[field] = convert(value)
 
         return cls(**config_data)
 
@@ -144,36 +176,29 @@ class Config(BaseModel):
         if config_path:
             return cls.load_from_file(config_path)
 
-        # Try environment variables
-        env_config = cls.load_from_env()
-
-        # If no environment config was found, use defaults
-        if not any([env_config.debug, env_config.logging.file, env_config.tool_configs]):
+        # Only read environment variables if at least one is present
+        if _ENV_KEYS.isdisjoint(os.environ.keys()):
             return cls.load_default()
 
-        return env_config
+        return cls.load_from_env()
 
     def save_to_file(self, config_path: Union[str, Path]) -> None:
         """Save configuration to a YAML file."""
         config_path = Path(config_path)
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to dict and handle Path objects
-        config_dict = self.model_dump()
-
-        def convert_paths(obj: Any) -> Any:
-            if isinstance(obj, Path):
-                return str(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_paths(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_paths(item) for item in obj]
-            return obj
-
-        config_dict = convert_paths(config_dict)
+        # JSON mode converts Path (and other non-YAML types) to plain values
+        config_dict = self.model_dump(mode="json")
 
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(
+                config_dict,
+                f,
+                Dumper=_SafeDumper,
+                default_flow_style=False,
+                indent=2,
+                sort_keys=False,
+            )
 
     def get_tool_config(self, tool_name: str) -> Dict[str, Any]:
         """Get configuration for a specific tool."""
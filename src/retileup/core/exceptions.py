@@ -8,6 +8,9 @@ for programmatic handling and structured error responses.
 from enum import Enum
 from typing import Any, Dict, Optional
 
+# Values that serialize as themselves in to_dict() output
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
 
 class ErrorCode(str, Enum):
     """Enumeration of error codes for structured error handling."""
@@ -89,6 +92,9 @@ class RetileupError(Exception):
         super().__init__(message)
         self.message = message
         self.error_code = error_code
+        # Resolved once; to_dict/__str__/__repr__ would otherwise go through
+        # the Enum ``value`` descriptor on every call
+        self._code_str = error_code.value
         self.context = context or {}
         self.cause = cause
 
@@ -101,7 +107,7 @@ class RetileupError(Exception):
         result = {
             "error_type": self.__class__.__name__,
             "message": self.message,
-            "error_code": self.error_code.value,
+            "error_code": self._code_str,
             "context": self.context,
         }
 
@@ -115,7 +121,10 @@ class RetileupError(Exception):
 
     def __str__(self) -> str:
         """String representation of the exception."""
-        parts = [f"{self.error_code.value}: {self.message}"]
+        if not self.context and not self.cause:
+            return f"{self._code_str}: {self.message}"
+
+        parts = [f"{self._code_str}: {self.message}"]
 
         if self.context:
             context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
@@ -130,7 +139,7 @@ class RetileupError(Exception):
         """Detailed string representation of the exception."""
         return (
             f"<{self.__class__.__name__}("
-            f"error_code='{self.error_code.value}', "
+            f"error_code='{self._code_str}', "
             f"message='{self.message}', "
             f"context={self.context}"
             f")>"
@@ -171,16 +180,35 @@ class ValidationError(RetileupError):
             invalid_value: The invalid value that caused the error
         """
         # Add validation-specific context
-        validation_context = context or {}
-        if field_name:
-            validation_context["field_name"] = field_name
-        if invalid_value is not None:
-            validation_context["invalid_value"] = str(invalid_value)
-
-        super().__init__(message, error_code, validation_context, cause)
+        if field_name or invalid_value is not None:
+            context = context or {}
+            if field_name:
+                context["field_name"] = field_name
+            if invalid_value is not None:
+                # Kept as-is; converted to a string only when serialized
+                context["invalid_value"] = invalid_value
+
+        super().__init__(message, error_code, context, cause)
         self.field_name = field_name
         self.invalid_value = invalid_value
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the exception to a dictionary for serialization.
+
+        Non-primitive invalid values are converted to strings here rather
+        than when the error is raised.
+
+        Returns:
+            Dictionary representation of the exception
+        """
+        result = super().to_dict()
+
+        invalid_value = self.context.get("invalid_value")
+        if not isinstance(invalid_value, _PRIMITIVE_TYPES):
+            result["context"] = {**self.context, "invalid_value": str(invalid_value)}
+
+        return result
+
 
 class ProcessingError(RetileupError):
     """Exception raised when image processing fails.
@@ -216,13 +244,14 @@ class ProcessingError(RetileupError):
             stage: Processing stage where the error occurred
         """
         # Add processing-specific context
-        processing_context = context or {}
-        if tool_name:
-            processing_context["tool_name"] = tool_name
-        if stage:
-            processing_context["stage"] = stage
-
-        super().__init__(message, error_code, processing_context, cause)
+        if tool_name or stage:
+            context = context or {}
+            if tool_name:
+                context["tool_name"] = tool_name
+            if stage:
+                context["stage"] = stage
+
+        super().__init__(message, error_code, context, cause)
         self.tool_name = tool_name
         self.stage = stage
 
@@ -260,13 +289,14 @@ class ConfigurationError(RetileupError):
             config_section: Section of configuration that failed
         """
         # Add configuration-specific context
-        config_context = context or {}
-        if config_path:
-            config_context["config_path"] = config_path
-        if config_section:
-            config_context["config_section"] = config_section
-
-        super().__init__(message, error_code, config_context, cause)
+        if config_path or config_section:
+            context = context or {}
+            if config_path:
+                context["config_path"] = config_path
+            if config_section:
+                context["config_section"] = config_section
+
+        super().__init__(message, error_code, context, cause)
         self.config_path = config_path
         self.config_section = config_section
 
@@ -306,15 +336,16 @@ class WorkflowError(RetileupError):
             step_index: Index of the workflow step that failed
         """
         # Add workflow-specific context
-        workflow_context = context or {}
-        if workflow_name:
-            workflow_context["workflow_name"] = workflow_name
-        if step_name:
-            workflow_context["step_name"] = step_name
-        if step_index is not None:
-            workflow_context["step_index"] = step_index
-
-        super().__init__(message, error_code, workflow_context, cause)
+        if workflow_name or step_name or step_index is not None:
+            context = context or {}
+            if workflow_name:
+                context["workflow_name"] = workflow_name
+            if step_name:
+                context["step_name"] = step_name
+            if step_index is not None:
+                context["step_index"] = step_index
+
+        super().__init__(message, error_code, context, cause)
         self.workflow_name = workflow_name
         self.step_name = step_name
         self.step_index = step_index
@@ -353,13 +384,14 @@ class RegistryError(RetileupError):
             registry_operation: Registry operation that failed
         """
         # Add registry-specific context
-        registry_context = context or {}
-        if tool_name:
-            registry_context["tool_name"] = tool_name
-        if registry_operation:
-            registry_context["registry_operation"] = registry_operation
-
-        super().__init__(message, error_code, registry_context, cause)
+        if tool_name or registry_operation:
+            context = context or {}
+            if tool_name:
+                context["tool_name"] = tool_name
+            if registry_operation:
+                context["registry_operation"] = registry_operation
+
+        super().__init__(message, error_code, context, cause)
         self.tool_name = tool_name
         self.registry_operation = registry_operation
 
@@ -397,13 +429,14 @@ class SecurityError(RetileupError):
             attempted_action: Action that was attempted and blocked
         """
         # Add security-specific context
-        security_context = context or {}
-        if security_policy:
-            security_context["security_policy"] = security_policy
-        if attempted_action:
-            security_context["attempted_action"] = attempted_action
-
-        super().__init__(message, error_code, security_context, cause)
+        if security_policy or attempted_action:
+            context = context or {}
+            if security_policy:
+                context["security_policy"] = security_policy
+            if attempted_action:
+                context["attempted_action"] = attempted_action
+
+        super().__init__(message, error_code, context, cause)
         self.security_policy = security_policy
         self.attempted_action = attempted_action
 
@@ -443,15 +476,16 @@ class ResourceError(RetileupError):
             current_usage: Current resource usage when error occurred
         """
         # Add resource-specific context
-        resource_context = context or {}
-        if resource_type:
-            resource_context["resource_type"] = resource_type
-        if resource_limit:
-            resource_context["resource_limit"] = resource_limit
-        if current_usage:
-            resource_context["current_usage"] = current_usage
-
-        super().__init__(message, error_code, resource_context, cause)
+        if resource_type or resource_limit or current_usage:
+            context = context or {}
+            if resource_type:
+                context["resource_type"] = resource_type
+            if resource_limit:
+                context["resource_limit"] = resource_limit
+            if current_usage:
+                context["current_usage"] = current_usage
+
+        super().__init__(message, error_code, context, cause)
         self.resource_type = resource_type
         self.resource_limit = resource_limit
         self.current_usage = current_usage
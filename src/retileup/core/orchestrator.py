@@ -3,12 +3,12 @@
 import asyncio
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from contextlib import contextmanager
-from typing import Any, Dict, Generator, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Protocol, Union, cast
 
 from PIL import Image
 
+from ..tools.base import BaseTool
 from .config import Config
 from .registry import ToolRegistry
 from .workflow import Workflow, WorkflowStep, StepStatus
@@ -21,6 +21,20 @@ class WorkflowExecutionError(Exception):
     pass
 
 
+class _AsyncImageTool(Protocol):
+    """Optional interface of tools that process images in a coroutine."""
+
+    def validate_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        ...
+
+    async def process_image_async(
+        self,
+        image: Image.Image,
+        parameters: Dict[str, Any]
+    ) -> Union[Image.Image, List[Image.Image]]:
+        ...
+
+
 class StepExecutionResult:
     """Result of executing a workflow step."""
 
@@ -65,19 +79,19 @@ class WorkflowOrchestrator:
         self.registry = registry
         self.config = config or Config.load_default()
         self._executor: Optional[ThreadPoolExecutor] = None
+        self._tool_cache: Dict[str, BaseTool] = {}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool executor, creating it on first use.
 
-    @contextmanager
-    def _get_executor(self) -> Generator[ThreadPoolExecutor, None, None]:
-        """Get thread pool executor context manager."""
-        if self._executor is None:
-            self._executor = ThreadPoolExecutor(
+        The executor is kept alive for reuse until cleanup() is called.
+        """
+        executor = self._executor
+        if executor is None:
+            executor = self._executor = ThreadPoolExecutor(
                 max_workers=self.config.performance.max_workers
             )
-        try:
-            yield self._executor
-        finally:
-            # Keep the executor alive for reuse
-            pass
+        return executor
 
     def execute_step(
         self,
@@ -95,55 +109,179 @@ class WorkflowOrchestrator:
         Returns:
             Step execution result
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         step.status = StepStatus.RUNNING
 
         try:
-            # Get the tool
-            tool = self.registry.create_tool(step.tool_name)
+            # Get the tool; a missing tool is an expected failure, not raised
+            tool = self._get_tool(step.tool_name)
             if tool is None:
-                raise WorkflowExecutionError(f"Tool '{step.tool_name}' not found")
-
-            # Merge global parameters with step parameters
-            merged_parameters = {}
-            if global_parameters:
-                merged_parameters.update(global_parameters)
-            merged_parameters.update(step.parameters)
+                return self._fail_step(
+                    step, WorkflowExecutionError(f"Tool '{step.tool_name}' not found"), start_time
+                )
 
             # Validate parameters
-            validated_parameters = tool.validate_parameters(merged_parameters)
+            validated_parameters = tool.validate_parameters(
+                self._merge_parameters(step, global_parameters)
+            )
 
             # Execute the tool
-            logger.info(f"Executing step '{step.name}' with tool '{step.tool_name}'")
+            # Per-step messages are formatted lazily, only if INFO is enabled
+            logger.info("Executing step '%s' with tool '%s'", step.name, step.tool_name)
             result = tool.process_image(image, validated_parameters)
 
-            execution_time = time.time() - start_time
-            step.status = StepStatus.COMPLETED
-            step.execution_time = execution_time
+            return self._complete_step(step, result, start_time)
+
+        except Exception as e:
+            return self._fail_step(step, e, start_time)
+
+    async def execute_step_async(
+        self,
+        step: WorkflowStep,
+        image: Image.Image,
+        global_parameters: Optional[Dict[str, Any]] = None
+    ) -> StepExecutionResult:
+        """Execute a single workflow step from a coroutine.
+
+        Tools providing a ``process_image_async`` coroutine are awaited on the
+        running event loop, so I/O-bound steps can overlap. Other tools run
+        through execute_step in the orchestrator's thread pool.
+
+        Args:
+            step: The step to execute
+            image: Input image
+            global_parameters: Global workflow parameters
+
+        Returns:
+            Step execution result
+        """
+        tool_class = self.registry.get_tool_class(step.tool_name, track_usage=False)
+        if tool_class is None or not hasattr(tool_class, "process_image_async"):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), self.execute_step, step, image, global_parameters
+            )
 
-            logger.info(f"Step '{step.name}' completed in {execution_time:.2f}s")
+        start_time = time.perf_counter()
+        step.status = StepStatus.RUNNING
 
-            return StepExecutionResult(
-                step=step,
-                success=True,
-                result=result,
-                execution_time=execution_time
+        try:
+            tool = self._get_tool(step.tool_name)
+            if tool is None:
+                return self._fail_step(
+                    step, WorkflowExecutionError(f"Tool '{step.tool_name}' not found"), start_time
+                )
+            async_tool = cast("_AsyncImageTool", tool)
+
+            validated_parameters = async_tool.validate_parameters(
+                self._merge_parameters(step, global_parameters)
             )
 
+            logger.info("Executing step '%s' with tool '%s'", step.name, step.tool_name)
+            result = await async_tool.process_image_async(image, validated_parameters)
+
+            return self._complete_step(step, result, start_time)
+
         except Exception as e:
-            execution_time = time.time() - start_time
-            step.status = StepStatus.FAILED
-            step.error_message = str(e)
-            step.execution_time = execution_time
-
-            logger.error(f"Step '{step.name}' failed after {execution_time:.2f}s: {e}")
-
-            return StepExecutionResult(
-                step=step,
-                success=False,
-                error=e,
-                execution_time=execution_time
-            )
+            return self._fail_step(step, e, start_time)
+
+    def _merge_parameters(
+        self,
+        step: WorkflowStep,
+        global_parameters: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Merge global parameters with step parameters.
+
+        Always returns a fresh dict, so tools cannot modify the step definition.
+
+        Args:
+            step: The step being executed
+            global_parameters: Global workflow parameters
+
+        Returns:
+            Merged parameters, with step parameters taking precedence
+        """
+        if global_parameters:
+            return {**global_parameters, **step.parameters}
+        return dict(step.parameters)
+
+    def _get_tool(self, name: str) -> Optional[BaseTool]:
+        """Get a tool instance for a step, reusing instances of stateless tools.
+
+        Args:
+            name: Name of the tool
+
+        Returns:
+            Tool instance or None if the tool is not registered
+        """
+        tool = self._tool_cache.get(name)
+        # Reuse only while the registry still maps the name to the same class
+        if tool is not None and type(tool) is self.registry.get_tool_class(name):
+            return tool
+
+        tool = self.registry.create_tool(name)
+        if tool is not None and not tool.stateful:
+            self._tool_cache[name] = tool
+        return tool
+
+    def _complete_step(
+        self,
+        step: WorkflowStep,
+        result: Optional[Union[Image.Image, List[Image.Image]]],
+        start_time: float
+    ) -> StepExecutionResult:
+        """Mark a step as completed and build its execution result.
+
+        Args:
+            step: The step that completed
+            result: The processing result
+            start_time: perf_counter() reading taken when the step started
+
+        Returns:
+            Successful step execution result
+        """
+        execution_time = time.perf_counter() - start_time
+        step.status = StepStatus.COMPLETED
+        step.execution_time = execution_time
+
+        logger.info("Step '%s' completed in %.2fs", step.name, execution_time)
+
+        return StepExecutionResult(
+            step=step,
+            success=True,
+            result=result,
+            execution_time=execution_time
+        )
+
+    def _fail_step(
+        self,
+        step: WorkflowStep,
+        error: Exception,
+        start_time: float
+    ) -> StepExecutionResult:
+        """Mark a step as failed and build its execution result.
+
+        Args:
+            step: The step that failed
+            error: The error that caused the failure
+            start_time: perf_counter() reading taken when the step started
+
+        Returns:
+            Failed step execution result
+        """
+        execution_time = time.perf_counter() - start_time
+        step.status = StepStatus.FAILED
+        step.error_message = str(error)
+        step.execution_time = execution_time
+
+        logger.error("Step '%s' failed after %.2fs: %s", step.name, execution_time, error)
+
+        return StepExecutionResult(
+            step=step,
+            success=False,
+            error=error,
+            execution_time=execution_time
+        )
 
     def execute_workflow_sequential(
         self,
@@ -152,45 +290,154 @@ class WorkflowOrchestrator:
     ) -> List[StepExecutionResult]:
         """Execute workflow steps sequentially.
 
+        Steps run in dependency layer order (workflow order within a layer),
+        so every step runs after the steps it depends on. Workflows without
+        dependencies run in workflow order.
+
         Args:
             workflow: The workflow to execute
             image: Input image
 
         Returns:
-            List of step execution results
+            List of step execution results, in execution order
         """
         results = []
         current_image = image
-
-        for step in workflow.get_enabled_steps():
-            # Check if step should be executed (condition evaluation could go here)
-            if not step.enabled:
-                step.status = StepStatus.SKIPPED
+        steps = self._ordered_steps(workflow)
+        steps_by_name = {step.name: step for step in steps}
+        global_parameters = workflow.global_parameters
+
+        # Walk the step list by index so stopping early needs no list search
+        for index, step in enumerate(steps):
+            # Disabled steps and steps whose dependencies did not complete
+            # are not executed (condition evaluation could go here)
+            if not self._can_run(step, steps_by_name):
                 continue
 
             # Execute the step
-            result = self.execute_step(step, current_image, workflow.global_parameters)
+            result = self.execute_step(step, current_image, global_parameters)
             results.append(result)
 
-            # Update current image for next step
-            if result.success and isinstance(result.result, Image.Image):
-                current_image = result.result
-            elif result.success and isinstance(result.result, list) and result.result:
-                # If multiple images returned, use the first one
-                current_image = result.result[0]
-
-            # Stop on error if configured
-            if not result.success and workflow.stop_on_error:
-                logger.error(f"Stopping workflow due to error in step '{step.name}'")
-                # Mark remaining steps as skipped
-                remaining_steps = workflow.steps[workflow.steps.index(step) + 1:]
-                for remaining_step in remaining_steps:
-                    if remaining_step.enabled:
-                        remaining_step.status = StepStatus.SKIPPED
+            if result.success:
+                # Update current image for next step
+                current_image = self._next_image(result, current_image)
+            elif workflow.stop_on_error:
+                # Stop on error if configured
+                self._skip_remaining_steps(steps, index)
                 break
 
         return results
 
+    async def execute_workflow_sequential_async(
+        self,
+        workflow: Workflow,
+        image: Image.Image
+    ) -> List[StepExecutionResult]:
+        """Execute workflow steps sequentially from a coroutine.
+
+        Steps run in the same order as in execute_workflow_sequential.
+
+        Args:
+            workflow: The workflow to execute
+            image: Input image
+
+        Returns:
+            List of step execution results, in execution order
+        """
+        results = []
+        current_image = image
+        steps = self._ordered_steps(workflow)
+        steps_by_name = {step.name: step for step in steps}
+        global_parameters = workflow.global_parameters
+
+        for index, step in enumerate(steps):
+            if not self._can_run(step, steps_by_name):
+                continue
+
+            result = await self.execute_step_async(step, current_image, global_parameters)
+            results.append(result)
+
+            if result.success:
+                current_image = self._next_image(result, current_image)
+            elif workflow.stop_on_error:
+                self._skip_remaining_steps(steps, index)
+                break
+
+        return results
+
+    def _ordered_steps(self, workflow: Workflow) -> List[WorkflowStep]:
+        """Get the workflow's steps with every step after its dependencies.
+
+        Args:
+            workflow: The workflow to order
+
+        Returns:
+            Steps of each dependency layer in turn, in workflow order within a layer
+
+        Raises:
+            ValueError: If a dependency is unknown or the dependencies contain a cycle
+        """
+        return [step for layer in workflow.topological_layers() for step in layer]
+
+    def _can_run(self, step: WorkflowStep, steps_by_name: Dict[str, WorkflowStep]) -> bool:
+        """Check whether a step should run now.
+
+        Disabled steps are left pending. Steps whose dependencies did not all
+        complete (because they failed, were skipped or are disabled) are
+        marked as skipped.
+
+        Args:
+            step: The step to check
+            steps_by_name: All workflow steps by name
+
+        Returns:
+            True if the step is enabled and its dependencies have completed
+        """
+        if not step.enabled:
+            return False
+        if all(
+            steps_by_name[dependency].status == StepStatus.COMPLETED
+            for dependency in step.depends_on
+        ):
+            return True
+        logger.info("Skipping step '%s': its dependencies did not complete", step.name)
+        step.status = StepStatus.SKIPPED
+        return False
+
+    def _next_image(
+        self,
+        result: StepExecutionResult,
+        current_image: Image.Image
+    ) -> Image.Image:
+        """Get the image to pass on to the step after a successful one.
+
+        Args:
+            result: Result of the successful step
+            current_image: Image the step was given
+
+        Returns:
+            The step's output image, or current_image if it produced none
+        """
+        output = result.result
+        if isinstance(output, Image.Image):
+            return output
+        if isinstance(output, list) and output:
+            # If multiple images returned, use the first one
+            return output[0]
+        return current_image
+
+    def _skip_remaining_steps(self, steps: List[WorkflowStep], index: int) -> None:
+        """Mark enabled steps after a failed one as skipped.
+
+        Args:
+            steps: All workflow steps
+            index: Index of the step that failed
+        """
+        logger.error("Stopping workflow due to error in step '%s'", steps[index].name)
+        for remaining_step in steps[index + 1:]:
+            if remaining_step.enabled:
+                remaining_step.status = StepStatus.SKIPPED
+
     def execute_workflow_parallel(
         self,
         workflow: Workflow,
@@ -198,54 +445,183 @@ class WorkflowOrchestrator:
     ) -> List[StepExecutionResult]:
         """Execute workflow steps in parallel.
 
+        Steps run one dependency layer at a time: each step starts once the
+        steps it depends on have finished, concurrently with the other steps
+        of its layer. Every step receives the original image.
+
         Args:
             workflow: The workflow to execute
             image: Input image
 
         Returns:
-            List of step execution results
+            List of step execution results, layer by layer in step order
 
-        Note:
-            This is a simplified parallel execution that runs all enabled steps
-            concurrently with the same input image. More sophisticated parallel
-            execution would require dependency graphs.
+        Raises:
+            ValueError: If a dependency is unknown or the dependencies contain a cycle
         """
-        enabled_steps = workflow.get_enabled_steps()
+        results: List[StepExecutionResult] = []
+        steps_by_name = {step.name: step for step in workflow.steps}
+
+        # Decode once up front so steps sharing the image never load it concurrently
+        image.load()
+
+        for layer in workflow.topological_layers():
+            steps = [step for step in layer if self._can_run(step, steps_by_name)]
+            results.extend(self._execute_layer(steps, image, workflow.global_parameters))
+
+        return results
+
+    def _execute_layer(
+        self,
+        steps: List[WorkflowStep],
+        image: Image.Image,
+        global_parameters: Dict[str, Any]
+    ) -> List[StepExecutionResult]:
+        """Execute independent steps concurrently on the same image.
+
+        Args:
+            steps: Steps to execute
+            image: Input image, already loaded
+            global_parameters: Global workflow parameters
+
+        Returns:
+            List of step execution results, in step order
+        """
+        if self.config.performance.max_workers <= 1 or len(steps) <= 1:
+            # A single worker runs the steps one by one anyway; skip the thread pool
+            return [
+                self.execute_step(
+                    step,
+                    image.copy() if self._mutates_input(step) else image,
+                    global_parameters
+                )
+                for step in steps
+            ]
+
+        executor = self._get_executor()
         results = []
 
-        with self._get_executor() as executor:
-            # Submit all steps for execution
-            future_to_step = {
-                executor.submit(
-                    self.execute_step,
+        # Submit all steps for execution
+        futures = [
+            executor.submit(
+                self.execute_step,
+                step,
+                # Only tools that modify their input need a private copy
+                image.copy() if self._mutates_input(step) else image,
+                global_parameters
+            )
+            for step in steps
+        ]
+
+        # Collect results in step order; total time is bounded by the slowest step
+        for step, future in zip(steps, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # This shouldn't happen as exceptions are caught in execute_step
+                logger.error(f"Unexpected error in step '{step.name}': {e}")
+                step.status = StepStatus.FAILED
+                step.error_message = str(e)
+                results.append(StepExecutionResult(
+                    step=step,
+                    success=False,
+                    error=e
+                ))
+
+        return results
+
+    def _mutates_input(self, step: WorkflowStep) -> bool:
+        """Check whether a step's tool modifies its input image in place.
+
+        Args:
+            step: The step to check
+
+        Returns:
+            True if the step's tool mutates its input image
+        """
+        tool_class = self.registry.get_tool_class(step.tool_name, track_usage=False)
+        return tool_class is not None and tool_class.mutates_input
+
+    async def execute_workflow_parallel_async(
+        self,
+        workflow: Workflow,
+        image: Image.Image
+    ) -> List[StepExecutionResult]:
+        """Execute workflow steps concurrently from a coroutine.
+
+        Like execute_workflow_parallel, steps run one dependency layer at a
+        time and every step receives the original image.
+
+        Args:
+            workflow: The workflow to execute
+            image: Input image
+
+        Returns:
+            List of step execution results, layer by layer in step order
+
+        Raises:
+            ValueError: If a dependency is unknown or the dependencies contain a cycle
+        """
+        results: List[StepExecutionResult] = []
+        steps_by_name = {step.name: step for step in workflow.steps}
+
+        # Decode once up front so steps sharing the image never load it concurrently
+        image.load()
+
+        for layer in workflow.topological_layers():
+            results.extend(await asyncio.gather(*(
+                self.execute_step_async(
                     step,
-                    image.copy(),  # Each step gets a copy of the original image
+                    image.copy() if self._mutates_input(step) else image,
                     workflow.global_parameters
-                ): step
-                for step in enabled_steps
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_step):
-                step = future_to_step[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    # This shouldn't happen as exceptions are caught in execute_step
-                    logger.error(f"Unexpected error in step '{step.name}': {e}")
-                    step.status = StepStatus.FAILED
-                    step.error_message = str(e)
-                    results.append(StepExecutionResult(
-                        step=step,
-                        success=False,
-                        error=e
-                    ))
-
-        # Sort results by original step order
-        step_order = {step.name: i for i, step in enumerate(enabled_steps)}
-        results.sort(key=lambda r: step_order.get(r.step.name, float('inf')))
+                )
+                for step in layer
+                if self._can_run(step, steps_by_name)
+            )))
+
+        return results
+
+    async def execute_workflow_async(
+        self,
+        workflow: Workflow,
+        image: Image.Image,
+        validate: bool = True
+    ) -> List[StepExecutionResult]:
+        """Execute a workflow from a coroutine.
+
+        Args:
+            workflow: The workflow to execute
+            image: Input image
+            validate: Whether to validate the workflow before execution
+
+        Returns:
+            List of step execution results
+
+        Raises:
+            WorkflowExecutionError: If workflow validation fails
+        """
+        if validate:
+            errors = workflow.validate_workflow(self.registry)
+            if errors:
+                raise WorkflowExecutionError(f"Workflow validation failed: {errors}")
+
+        workflow.reset_workflow()
+
+        logger.info("Starting execution of workflow '%s'", workflow.name)
+        start_time = time.perf_counter()
+
+        try:
+            if workflow.parallel_execution:
+                results = await self.execute_workflow_parallel_async(workflow, image)
+            else:
+                results = await self.execute_workflow_sequential_async(workflow, image)
+        except Exception as e:
+            total_time = time.perf_counter() - start_time
+            logger.error("Workflow '%s' failed after %.2fs: %s", workflow.name, total_time, e)
+            raise WorkflowExecutionError(f"Workflow execution failed: {e}") from e
 
+        total_time = time.perf_counter() - start_time
+        logger.info("Workflow '%s' completed in %.2fs", workflow.name, total_time)
         return results
 
     def execute_workflow(
@@ -277,7 +653,7 @@ class WorkflowOrchestrator:
         workflow.reset_workflow()
 
         logger.info(f"Starting execution of workflow '{workflow.name}'")
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Choose execution strategy
@@ -286,7 +662,7 @@ class WorkflowOrchestrator:
             else:
                 results = self.execute_workflow_sequential(workflow, image)
 
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             summary = workflow.get_execution_summary()
 
             logger.info(
@@ -298,7 +674,7 @@ class WorkflowOrchestrator:
             return results
 
         except Exception as e:
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logger.error(f"Workflow '{workflow.name}' failed after {total_time:.2f}s: {e}")
             raise WorkflowExecutionError(f"Workflow execution failed: {e}") from e
 
@@ -322,6 +698,7 @@ class WorkflowOrchestrator:
 
     def cleanup(self) -> None:
         """Clean up resources."""
+        self._tool_cache.clear()
         if self._executor:
             self._executor.shutdown(wait=True)
             self._executor = None
\ No newline at end of file
@@ -6,13 +6,16 @@ It serves as the central hub for tool registration and coordination within
 the ReTileUp framework.
 """
 
+import fnmatch
 import importlib
 import importlib.util
 import logging
+import os
+import sys
 import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 from ..tools.base import BaseTool, ToolConfig, ToolResult
 from .exceptions import RegistryError, ErrorCode, registry_error
@@ -23,6 +26,19 @@ logger = logging.getLogger(__name__)
 class ToolMetadata(object):
     """Extended metadata for registered tools."""
 
+    __slots__ = (
+        "_static_dict",
+        "description",
+        "last_used",
+        "name",
+        "plugin_path",
+        "registration_time",
+        "source_module",
+        "tool_class",
+        "usage_count",
+        "version",
+    )
+
     def __init__(
         self,
         tool_class: Type[BaseTool],
@@ -54,16 +70,21 @@ class ToolMetadata(object):
         self.usage_count = 0
         self.last_used = None
 
+        # Only the usage fields change after registration
+        self._static_dict: Dict[str, Any] = {
+            "name": name,
+            "version": version,
+            "description": description,
+            "class_name": tool_class.__name__,
+            "module": source_module,
+            "plugin_path": str(plugin_path) if plugin_path else None,
+            "registration_time": registration_time,
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary."""
         return {
-            "name": self.name,
-            "version": self.version,
-            "description": self.description,
-            "class_name": self.tool_class.__name__,
-            "module": self.source_module,
-            "plugin_path": str(self.plugin_path) if self.plugin_path else None,
-            "registration_time": self.registration_time,
+            **self._static_dict,
             "usage_count": self.usage_count,
             "last_used": self.last_used,
         }
@@ -101,10 +122,18 @@ class ToolRegistry:
         Creates an empty registry with thread-safe access patterns
         and prepares for tool discovery and registration.
         """
+        # Copy-on-write: the dict is never modified once published. Writers
+        # build a new one under the lock and swap it in, so readers can use
+        # the current snapshot without locking.
         self._tools: Dict[str, ToolMetadata] = {}
         self._plugin_directories: List[Path] = []
+        # Guards writers and the other registry state
         self._lock = threading.RLock()
+        # Guards usage statistics only
+        self._usage_lock = threading.Lock()
         self._discovery_cache: Dict[str, float] = {}
+        # Plugin file -> ((mtime_ns, size), tool classes found in it)
+        self._plugin_cache: Dict[Path, Tuple[Tuple[int, int], List[Type[BaseTool]]]] = {}
         self._auto_discovery_enabled = True
 
         # Initialize with default plugin directories
@@ -114,7 +143,7 @@ class ToolRegistry:
         """Setup default plugin directories for auto-discovery."""
         # Built-in tools directory
         builtin_dir = Path(__file__).parent.parent / "tools"
-        if builtin_dir.exists():
+        if builtin_dir.is_dir():
             self._plugin_directories.append(builtin_dir)
 
         # User plugin directories
@@ -125,7 +154,8 @@ class ToolRegistry:
         ]
 
         for directory in user_dirs:
-            if directory.exists() and directory.is_dir():
+            # is_dir() is False for missing paths too, so one stat suffices
+            if directory.is_dir():
                 self._plugin_directories.append(directory)
 
     def register_tool(
@@ -133,6 +163,7 @@ class ToolRegistry:
         tool_class: Type[BaseTool],
         name: Optional[str] = None,
         force: bool = False,
+        plugin_path: Optional[Path] = None,
     ) -> None:
         """Register a tool class with enhanced validation.
 
@@ -140,23 +171,26 @@ class ToolRegistry:
             tool_class: The tool class to register (can be class or instance)
             name: Optional custom name for the tool
             force: Whether to force registration even if tool exists
+            plugin_path: Path to the plugin file the tool was loaded from
 
         Raises:
             RegistryError: If registration fails or tool validation fails
         """
+        # Handle case where an instance is passed instead of a class
+        if not isinstance(tool_class, type):
+            # If it's an instance, get its class
+            actual_tool_class = type(tool_class)
+        else:
+            actual_tool_class = tool_class
+        tool_instance = None
+
         with self._lock:
             try:
-                # Handle case where an instance is passed instead of a class
-                if not isinstance(tool_class, type):
-                    # If it's an instance, get its class
-                    actual_tool_class = type(tool_class)
-                else:
-                    actual_tool_class = tool_class
-
                 # Validate the tool class
                 self._validate_tool_class(actual_tool_class)
 
-                # Create instance to get metadata (handle instantiation failures)
+                # Create a single instance to validate and read metadata
+                # (handle instantiation failures)
                 try:
                     if isinstance(tool_class, type):
                         # It's a class, create an instance
@@ -165,9 +199,13 @@ class ToolRegistry:
                         # It's already an instance
                         tool_instance = tool_class
 
+                    self._validate_tool_properties(tool_instance)
+
                     tool_name = name or tool_instance.name
                     tool_version = tool_instance.version
                     tool_description = tool_instance.description
+                except RegistryError:
+                    raise
                 except Exception as inst_error:
                     # If instantiation fails, use class name and defaults
                     logger.warning(f"Failed to instantiate {actual_tool_class.__name__} for metadata - using defaults: {inst_error}")
@@ -185,6 +223,11 @@ class ToolRegistry:
                     )
                     return
 
+                # Interned names let lookups with literal tool names
+                # match by identity. sys.intern() only accepts exact str, so
+                # str subclasses such as str-Enum names are copied by value
+                tool_name = sys.intern(str.__str__(tool_name))
+
                 # Create metadata
                 metadata = ToolMetadata(
                     tool_class=actual_tool_class,
@@ -193,10 +236,13 @@ class ToolRegistry:
                     description=tool_description,
                     registration_time=time.time(),
                     source_module=actual_tool_class.__module__,
+                    plugin_path=plugin_path,
                 )
 
                 # Register the tool
-                self._tools[tool_name] = metadata
+                tools = dict(self._tools)
+                tools[tool_name] = metadata
+                self._tools = tools
 
                 logger.info(
                     f"Registered tool: {tool_name} v{tool_version} "
@@ -206,7 +252,7 @@ class ToolRegistry:
             except Exception as e:
                 raise registry_error(
                     f"Failed to register tool {actual_tool_class.__name__}: {str(e)}",
-                    tool_name=getattr(tool_instance if 'tool_instance' in locals() else actual_tool_class, "name", actual_tool_class.__name__),
+                    tool_name=getattr(tool_instance, "name", actual_tool_class.__name__),
                     operation="register",
                     cause=e,
                 ) from e
@@ -243,28 +289,23 @@ class ToolRegistry:
                     error_code=ErrorCode.TOOL_REGISTRATION_ERROR,
                 )
 
-        # Try to instantiate only to check properties (optional validation)
-        try:
-            instance = tool_class()
-
-            # Check required properties
-            required_props = ["name", "description", "version"]
-            for prop in required_props:
-                value = getattr(instance, prop)
-                if not value or not isinstance(value, str):
-                    raise RegistryError(
-                        f"Tool {tool_class.__name__} must have valid {prop} property",
-                        error_code=ErrorCode.TOOL_REGISTRATION_ERROR,
-                    )
+    def _validate_tool_properties(self, tool_instance: BaseTool) -> None:
+        """Validate the metadata properties of a tool instance.
 
-        except RegistryError:
-            # Re-raise registry errors as-is
-            raise
-        except Exception:
-            # For other exceptions during instantiation, we'll allow registration
-            # but warn that instantiation might fail later
-            logger.warning(f"Tool {tool_class.__name__} failed instantiation during validation - "
-                         "registration allowed but creation may fail")
+        Args:
+            tool_instance: Tool instance to validate
+
+        Raises:
+            RegistryError: If a required property is empty or not a string
+        """
+        required_props = ["name", "description", "version"]
+        for prop in required_props:
+            value = getattr(tool_instance, prop)
+            if not value or not isinstance(value, str):
+                raise RegistryError(
+                    f"Tool {type(tool_instance).__name__} must have valid {prop} property",
+                    error_code=ErrorCode.TOOL_REGISTRATION_ERROR,
+                )
 
     def unregister_tool(self, name: str) -> bool:
         """Unregister a tool with logging and cleanup.
@@ -277,8 +318,9 @@ class ToolRegistry:
         """
         with self._lock:
             if name in self._tools:
-                metadata = self._tools[name]
-                del self._tools[name]
+                tools = dict(self._tools)
+                metadata = tools.pop(name)
+                self._tools = tools
                 logger.info(
                     f"Unregistered tool: {name} v{metadata.version} "
                     f"(used {metadata.usage_count} times)"
@@ -286,22 +328,25 @@ class ToolRegistry:
                 return True
             return False
 
-    def get_tool_class(self, name: str) -> Optional[Type[BaseTool]]:
+    def get_tool_class(self, name: str, track_usage: bool = True) -> Optional[Type[BaseTool]]:
         """Get a tool class by name with usage tracking.
 
         Args:
             name: Name of the tool
+            track_usage: Whether to count this lookup as a use of the tool
 
         Returns:
             Tool class or None if not found
         """
-        with self._lock:
-            metadata = self._tools.get(name)
-            if metadata:
+        metadata = self._tools.get(name)
+        if metadata is None:
+            return None
+
+        if track_usage:
+            with self._usage_lock:
                 metadata.usage_count += 1
                 metadata.last_used = time.time()
-                return metadata.tool_class
-            return None
+        return metadata.tool_class
 
     def create_tool(self, name: str) -> Optional[BaseTool]:
         """Create an instance of a tool with error handling.
@@ -348,9 +393,8 @@ class ToolRegistry:
         Returns:
             Tool metadata dictionary or None if not found
         """
-        with self._lock:
-            metadata = self._tools.get(name)
-            return metadata.to_dict() if metadata else None
+        metadata = self._tools.get(name)
+        return metadata.to_dict() if metadata else None
 
     def list_tools(self, include_metadata: bool = False) -> Union[List[str], List[Dict[str, Any]]]:
         """Get list of all registered tools.
@@ -361,10 +405,10 @@ class ToolRegistry:
         Returns:
             List of tool names or metadata dictionaries
         """
-        with self._lock:
-            if include_metadata:
-                return [metadata.to_dict() for metadata in self._tools.values()]
-            return list(self._tools.keys())
+        tools = self._tools
+        if include_metadata:
+            return [metadata.to_dict() for metadata in tools.values()]
+        return list(tools)
 
     def list_tools_by_pattern(self, pattern: str) -> List[str]:
         """Get list of tools matching a name pattern.
@@ -375,13 +419,8 @@ class ToolRegistry:
         Returns:
             List of tool names matching the pattern
         """
-        import fnmatch
-
-        with self._lock:
-            return [
-                name for name in self._tools.keys()
-                if fnmatch.fnmatch(name, pattern)
-            ]
+        # filter() normalises and compiles the pattern once for all names
+        return fnmatch.filter(self._tools, pattern)
 
     def get_tool_statistics(self) -> Dict[str, Any]:
         """Get registry statistics.
@@ -391,18 +430,21 @@ class ToolRegistry:
         """
         with self._lock:
             total_tools = len(self._tools)
-            total_usage = sum(metadata.usage_count for metadata in self._tools.values())
 
-            most_used = None
-            if self._tools:
-                most_used_metadata = max(
-                    self._tools.values(),
-                    key=lambda m: m.usage_count
-                )
-                most_used = {
-                    "name": most_used_metadata.name,
-                    "usage_count": most_used_metadata.usage_count,
-                }
+            # Total and most used tool in a single pass
+            total_usage = 0
+            best_count: int = -1
+            best: Optional[ToolMetadata] = None
+            for metadata in self._tools.values():
+                count = metadata.usage_count
+                total_usage += count
+                if count > best_count:
+                    best_count = count
+                    best = metadata
+
+            most_used = (
+                {"name": best.name, "usage_count": best_count} if best is not None else None
+            )
 
             return {
                 "total_tools": total_tools,
@@ -420,12 +462,11 @@ class ToolRegistry:
             auto_load: Whether to immediately load plugins from directory
         """
         directory = Path(directory)
-        if not directory.exists():
-            logger.warning(f"Plugin directory does not exist: {directory}")
-            return
-
         if not directory.is_dir():
-            logger.warning(f"Plugin path is not a directory: {directory}")
+            if directory.exists():
+                logger.warning(f"Plugin path is not a directory: {directory}")
+            else:
+                logger.warning(f"Plugin directory does not exist: {directory}")
             return
 
         with self._lock:
@@ -446,24 +487,33 @@ class ToolRegistry:
             Number of plugins loaded successfully
         """
         directory = Path(directory)
-        if not directory.exists() or not directory.is_dir():
-            logger.warning(f"Plugin directory does not exist: {directory}")
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            # Missing, not a directory, or unreadable (e.g. PermissionError)
+            logger.warning(f"Cannot scan plugin directory {directory}: {e}")
             return 0
 
         loaded_count = 0
         failed_count = 0
 
-        # Look for Python files in the directory
-        for plugin_file in directory.glob("*.py"):
-            if plugin_file.name.startswith("_"):
-                continue  # Skip private files
+        # Look for Python files in the directory, filtering on entry names
+        # and reusing each entry's stat for the plugin cache
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".py") or name.startswith("_"):
+                    continue  # Skip non-Python and private files
 
-            try:
-                loaded = self._load_plugin_file(plugin_file)
-                loaded_count += loaded
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"Failed to load plugin {plugin_file}: {e}")
+                plugin_file = directory / name
+                try:
+                    if not entry.is_file():
+                        continue
+                    loaded = self._load_plugin_file(plugin_file, entry.stat())
+                    loaded_count += loaded
+                except Exception as e:
+                    failed_count += 1
+                    logger.error(f"Failed to load plugin {plugin_file}: {e}")
 
         logger.info(
             f"Plugin loading complete: {loaded_count} loaded, "
@@ -471,39 +521,102 @@ class ToolRegistry:
         )
         return loaded_count
 
-    def _load_plugin_file(self, plugin_file: Path) -> int:
+    def _load_plugin_file(
+        self, plugin_file: Path, stat: Optional[os.stat_result] = None
+    ) -> int:
         """Load a single plugin file.
 
+        Tool classes found in a file are cached by the file's modification
+        time and size, so rescanning an unchanged file re-registers the known
+        classes without importing it again.
+
         Args:
             plugin_file: Path to plugin file
+            stat: Result of stat() on the file, if already known
 
         Returns:
             Number of tools loaded from the file
         """
-        # Check if this is a built-in tool (in retileup package structure)
-        retileup_root = Path(__file__).parent.parent
-        try:
-            relative_path = plugin_file.relative_to(retileup_root)
-            is_builtin = True
-        except ValueError:
-            is_builtin = False
-
-        if is_builtin:
-            # Handle built-in tools using proper package imports
-            return self._load_builtin_tool(plugin_file, relative_path)
+        if stat is None:
+            stat = plugin_file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._plugin_cache.get(plugin_file)
+        if cached is not None and cached[0] == signature:
+            tool_classes: List[Type[BaseTool]] = cached[1]
         else:
-            # Handle external plugins using isolated loading
-            return self._load_external_plugin(plugin_file)
+            # Check if this is a built-in tool (in retileup package structure)
+            retileup_root = Path(__file__).parent.parent
+            try:
+                relative_path = plugin_file.relative_to(retileup_root)
+                is_builtin = True
+            except ValueError:
+                is_builtin = False
+
+            if is_builtin:
+                # Handle built-in tools using proper package imports
+                loaded = self._load_builtin_tool(plugin_file, relative_path)
+            else:
+                # Handle external plugins using isolated loading
+                loaded = self._load_external_plugin(plugin_file)
+
+            if loaded is None:
+                return 0
+            tool_classes = loaded
+            self._plugin_cache[plugin_file] = (signature, tool_classes)
+
+        tools_loaded = 0
+        for tool_class in tool_classes:
+            try:
+                self.register_tool(tool_class, plugin_path=plugin_file)
+                tools_loaded += 1
+                logger.debug(f"Loaded tool {tool_class.__name__} from {plugin_file}")
+            except Exception as e:
+                logger.error(f"Failed to register tool {tool_class.__name__} from {plugin_file}: {e}")
+
+        return tools_loaded
 
-    def _load_builtin_tool(self, plugin_file: Path, relative_path: Path) -> int:
-        """Load a built-in tool using proper package imports.
+    def _find_tool_classes(self, module: Any) -> List[Type[BaseTool]]:
+        """Find the tool classes provided by a module.
+
+        A module can list its tools explicitly in ``__retileup_tools__``.
+        Otherwise the tool classes defined in the module itself are used;
+        tools it merely imports belong to the module that defines them.
+
+        Args:
+            module: Module to search
+
+        Returns:
+            List of BaseTool subclasses
+        """
+        explicit = getattr(module, "__retileup_tools__", None)
+        if explicit is not None:
+            return list(explicit)
+
+        # vars() reads the namespace directly, without dir()'s sorting or
+        # getattr() on every name
+        tool_classes = []
+        for attr in list(vars(module).values()):
+            if (
+                isinstance(attr, type) and
+                issubclass(attr, BaseTool) and
+                attr is not BaseTool and
+                attr.__module__ == module.__name__
+            ):
+                tool_classes.append(attr)
+        return tool_classes
+
+    def _load_builtin_tool(
+        self, plugin_file: Path, relative_path: Path
+    ) -> Optional[List[Type[BaseTool]]]:
+        """Load a built-in tool module using proper package imports.
 
         Args:
             plugin_file: Path to the tool file
             relative_path: Relative path from retileup root
 
         Returns:
-            Number of tools loaded from the file
+            Tool classes found in the module, or None if it failed to load
         """
         try:
             # Convert file path to module name
@@ -512,45 +625,20 @@ class ToolRegistry:
 
             # Import using standard Python import mechanism
             module = importlib.import_module(module_name)
-
-            tools_loaded = 0
-
-            # Look for tool classes in the module
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type) and
-                    issubclass(attr, BaseTool) and
-                    attr is not BaseTool
-                ):
-                    try:
-                        self.register_tool(attr)
-
-                        # Add plugin path to metadata
-                        tool_instance = attr()
-                        metadata = self._tools.get(tool_instance.name)
-                        if metadata:
-                            metadata.plugin_path = plugin_file
-
-                        tools_loaded += 1
-                        logger.debug(f"Loaded built-in tool {attr_name} from {module_name}")
-                    except Exception as e:
-                        logger.error(f"Failed to register built-in tool {attr_name} from {module_name}: {e}")
-
-            return tools_loaded
+            return self._find_tool_classes(module)
 
         except Exception as e:
             logger.error(f"Failed to load built-in tool {plugin_file}: {e}")
-            return 0
+            return None
 
-    def _load_external_plugin(self, plugin_file: Path) -> int:
+    def _load_external_plugin(self, plugin_file: Path) -> Optional[List[Type[BaseTool]]]:
         """Load an external plugin file using isolated loading.
 
         Args:
             plugin_file: Path to the plugin file
 
         Returns:
-            Number of tools loaded from the file
+            Tool classes found in the plugin, or None if it failed to load
         """
         try:
             spec = importlib.util.spec_from_file_location(
@@ -558,40 +646,15 @@ class ToolRegistry:
             )
             if not spec or not spec.loader:
                 logger.warning(f"Could not create module spec for {plugin_file}")
-                return 0
+                return None
 
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
-
-            tools_loaded = 0
-
-            # Look for tool classes in the module
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type) and
-                    issubclass(attr, BaseTool) and
-                    attr is not BaseTool
-                ):
-                    try:
-                        self.register_tool(attr)
-
-                        # Add plugin path to metadata
-                        tool_instance = attr()
-                        metadata = self._tools.get(tool_instance.name)
-                        if metadata:
-                            metadata.plugin_path = plugin_file
-
-                        tools_loaded += 1
-                        logger.debug(f"Loaded external plugin {attr_name} from {plugin_file}")
-                    except Exception as e:
-                        logger.error(f"Failed to register external plugin {attr_name} from {plugin_file}: {e}")
-
-            return tools_loaded
+            return self._find_tool_classes(module)
 
         except Exception as e:
             logger.error(f"Failed to load external plugin {plugin_file}: {e}")
-            return 0
+            return None
 
     def auto_discover_tools(self, force_refresh: bool = False) -> int:
         """Automatically discover and load tools from all directories.
@@ -606,17 +669,27 @@ class ToolRegistry:
             logger.debug("Auto-discovery is disabled")
             return 0
 
+        # Nothing to do when every directory was scanned recently; checked
+        # before taking the lock so repeated calls don't contend with writers
+        if not force_refresh:
+            current_time = time.monotonic()
+            if all(
+                self._scanned_recently(str(directory), current_time)
+                for directory in list(self._plugin_directories)
+            ):
+                logger.debug("Auto-discovery skipped: all plugin directories scanned recently")
+                return 0
+
         total_loaded = 0
 
         with self._lock:
             for directory in self._plugin_directories:
                 # Check cache to avoid unnecessary rescanning
                 cache_key = str(directory)
-                last_scan = self._discovery_cache.get(cache_key, 0)
-                current_time = time.time()
+                current_time = time.monotonic()
 
                 # Rescan if forced or if it's been more than 5 minutes
-                if force_refresh or (current_time - last_scan) > 300:
+                if force_refresh or not self._scanned_recently(cache_key, current_time):
                     loaded = self.load_plugins_from_directory(directory)
                     total_loaded += loaded
                     self._discovery_cache[cache_key] = current_time
@@ -624,6 +697,22 @@ class ToolRegistry:
         logger.info(f"Auto-discovery completed: {total_loaded} tools loaded")
         return total_loaded
 
+    def _scanned_recently(self, cache_key: str, current_time: float) -> bool:
+        """Check whether a directory was scanned within the discovery window.
+
+        Scan times come from time.monotonic(), so wall-clock adjustments
+        cannot make a directory look fresh or stale.
+
+        Args:
+            cache_key: Discovery cache key of the directory
+            current_time: Current monotonic time
+
+        Returns:
+            True if the directory does not need rescanning yet
+        """
+        last_scan = self._discovery_cache.get(cache_key)
+        return last_scan is not None and (current_time - last_scan) <= 300
+
     def enable_auto_discovery(self, enabled: bool = True) -> None:
         """Enable or disable auto-discovery.
 
@@ -692,8 +781,9 @@ class ToolRegistry:
 
         with self._lock:
             tool_count = len(self._tools)
-            self._tools.clear()
+            self._tools = {}
             self._discovery_cache.clear()
+            self._plugin_cache.clear()
             logger.info(f"Cleared tool registry ({tool_count} tools removed)")
 
     def export_registry_state(self) -> Dict[str, Any]:
@@ -701,6 +791,11 @@ class ToolRegistry:
 
         Returns:
             Registry state dictionary
+
+        Note:
+            The ``discovery_cache`` values are time.monotonic() readings of
+            the last scan of each directory. They are only meaningful within
+            the exporting process and are not wall-clock timestamps.
         """
         with self._lock:
             return {
@@ -744,9 +839,11 @@ def get_global_registry() -> ToolRegistry:
     if _global_registry is None:
         with _registry_lock:
             if _global_registry is None:
-                _global_registry = ToolRegistry()
-                # Perform initial auto-discovery
-                _global_registry.auto_discover_tools()
+                registry = ToolRegistry()
+                # Perform initial auto-discovery before publishing, so the
+                # lock-free check above never returns a half-populated registry
+                registry.auto_discover_tools()
+                _global_registry = registry
 
     return _global_registry
 
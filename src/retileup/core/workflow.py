@@ -2,10 +2,9 @@
 
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from PIL import Image
 
 from .registry import ToolRegistry
 
@@ -33,6 +32,10 @@ class WorkflowStep(BaseModel):
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
     condition: Optional[str] = Field(None, description="Condition for step execution")
     enabled: bool = Field(True, description="Whether the step is enabled")
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description="Names of steps that must complete before this step"
+    )
 
     # Step metadata
     tags: List[str] = Field(default_factory=list, description="Step tags")
@@ -100,10 +103,14 @@ class Workflow(BaseModel):
         if not v:
             raise ValueError("Workflow must have at least one step")
 
-        # Check for duplicate step names
-        step_names = [step.name for step in v]
-        if len(step_names) != len(set(step_names)):
-            raise ValueError("Workflow steps must have unique names")
+        # Check for duplicate step names, stopping at the first one
+        step_names = set()
+        for step in v:
+            if step.name in step_names:
+                raise ValueError(
+                    f"Workflow steps must have unique names (duplicate: {step.name!r})"
+                )
+            step_names.add(step.name)
 
         return v
 
@@ -195,6 +202,70 @@ class Workflow(BaseModel):
         """
         return [step for step in self.steps if tag in step.tags]
 
+    def topological_layers(self) -> List[List[WorkflowStep]]:
+        """Group steps into layers that can run concurrently.
+
+        Every step's dependencies are in earlier layers. Within a layer,
+        steps keep their workflow order.
+
+        Returns:
+            List of step layers
+
+        Raises:
+            ValueError: If a step depends on an unknown step or the
+                dependencies contain a cycle
+        """
+        steps_by_name = {step.name: step for step in self.steps}
+        remaining: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in steps_by_name}
+
+        for step in self.steps:
+            for dependency in step.depends_on:
+                if dependency not in steps_by_name:
+                    raise ValueError(
+                        f"Step '{step.name}' depends on unknown step '{dependency}'"
+                    )
+                dependents[dependency].append(step.name)
+            remaining[step.name] = len(step.depends_on)
+
+        # Kahn's algorithm, one layer of ready steps at a time
+        layer = [step for step in self.steps if not step.depends_on]
+        layers = []
+        placed = 0
+        while layer:
+            layers.append(layer)
+            placed += len(layer)
+            ready = set()
+            for step in layer:
+                for dependent in dependents[step.name]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        ready.add(dependent)
+            layer = [step for step in self.steps if step.name in ready]
+
+        if placed != len(self.steps):
+            raise ValueError("Circular dependency detected in workflow steps")
+
+        return layers
+
+    def iter_ready_steps(self) -> Iterator[WorkflowStep]:
+        """Iterate over pending steps whose dependencies have all completed.
+
+        Yields:
+            Enabled pending steps that are ready to run
+        """
+        completed = {
+            step.name for step in self.steps
+            if step.status == StepStatus.COMPLETED
+        }
+        for step in self.steps:
+            if (
+                step.enabled and
+                step.status == StepStatus.PENDING and
+                all(dependency in completed for dependency in step.depends_on)
+            ):
+                yield step
+
     def reset_workflow(self) -> None:
         """Reset all steps to pending status."""
         for step in self.steps:
@@ -216,10 +287,15 @@ class Workflow(BaseModel):
             if step.tool_name not in registry:
                 errors.append(f"Step '{step.name}': Tool '{step.tool_name}' not found in registry")
 
+        # Check that step dependencies resolve and contain no cycles
+        try:
+            self.topological_layers()
+        except ValueError as e:
+            errors.append(str(e))
+
         # Additional validation can be added here
         # - Check parameter schemas
         # - Validate conditions
-        # - Check for circular dependencies (if we add step dependencies)
 
         return errors
 
@@ -230,14 +306,22 @@ class Workflow(BaseModel):
             Dictionary containing execution statistics
         """
         total_steps = len(self.steps)
-        completed_steps = len(self.get_steps_by_status(StepStatus.COMPLETED))
-        failed_steps = len(self.get_steps_by_status(StepStatus.FAILED))
-        skipped_steps = len(self.get_steps_by_status(StepStatus.SKIPPED))
+        completed_steps = failed_steps = skipped_steps = 0
+        total_time = 0.0
 
-        total_time = sum(
-            step.execution_time for step in self.steps
-            if step.execution_time is not None
-        )
+        # Single pass; statuses are compared rather than used as dict keys
+        # because they may be stored as StepStatus members or plain values
+        for step in self.steps:
+            status = step.status
+            if status == StepStatus.COMPLETED:
+                completed_steps += 1
+            elif status == StepStatus.FAILED:
+                failed_steps += 1
+            elif status == StepStatus.SKIPPED:
+                skipped_steps += 1
+
+            if step.execution_time is not None:
+                total_time += step.execution_time
 
         return {
             "total_steps": total_steps,
@@ -253,6 +337,34 @@ class Workflow(BaseModel):
         return self.model_dump()
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Workflow":
-        """Create workflow from dictionary."""
-        return cls(**data)
\ No newline at end of file
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> "Workflow":
+        """Create workflow from dictionary.
+
+        Args:
+            data: Workflow data, e.g. as produced by to_dict()
+            trusted: Skip validation. Only for data this package serialized
+                itself; user-supplied data must be validated.
+
+        Returns:
+            The workflow
+        """
+        if not trusted:
+            return cls.model_validate(data)
+
+        steps = [WorkflowStep.model_construct(**step) for step in data.get("steps", ())]
+        return cls.model_construct(**{**data, "steps": steps})
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Workflow":
+        """Create workflow from a JSON document.
+
+        The JSON is parsed and validated in one step, without building an
+        intermediate dictionary first.
+
+        Args:
+            data: JSON text of a workflow
+
+        Returns:
+            The workflow
+        """
+        return cls.model_validate_json(data)
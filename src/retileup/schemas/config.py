@@ -5,11 +5,15 @@ framework, including tool configuration, workflow definitions, and
 validation decorators for structured configuration management.
 """
 
-import time
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+import re
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$')
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_FORMATS = frozenset({"PNG", "JPEG", "JPG", "BMP", "TIFF", "WEBP"})
+_VALID_PROGRESS_FORMATS = frozenset({"simple", "detailed", "minimal"})
 
 
 class LoggingConfigSchema(BaseModel):
@@ -26,10 +30,10 @@ class LoggingConfigSchema(BaseModel):
     @classmethod
     def validate_level(cls, v: str) -> str:
         """Validate logging level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Invalid logging level. Must be one of: {valid_levels}")
-        return v.upper()
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid logging level. Must be one of: {sorted(_VALID_LOG_LEVELS)}")
+        return level
 
 
 class PerformanceConfigSchema(BaseModel):
@@ -56,10 +60,10 @@ class OutputConfigSchema(BaseModel):
     @classmethod
     def validate_format(cls, v: str) -> str:
         """Validate output format."""
-        valid_formats = ["PNG", "JPEG", "JPG", "BMP", "TIFF", "WEBP"]
-        if v.upper() not in valid_formats:
-            raise ValueError(f"Invalid format. Must be one of: {valid_formats}")
-        return v.upper()
+        output_format = v.upper()
+        if output_format not in _VALID_FORMATS:
+            raise ValueError(f"Invalid format. Must be one of: {sorted(_VALID_FORMATS)}")
+        return output_format
 
 
 class ToolConfigSchema(BaseModel):
@@ -140,8 +144,7 @@ class ConfigSchema(BaseModel):
     @classmethod
     def validate_version(cls, v: str) -> str:
         """Validate version format."""
-        import re
-        if not re.match(r'^\d+\.\d+\.\d+$', v):
+        if not _VERSION_RE.match(v):
             raise ValueError("Version must be in format 'x.y.z'")
         return v
 
@@ -154,7 +157,12 @@ class ConfigSchema(BaseModel):
         Returns:
             Tool configuration schema
         """
-        return self.tools.get(tool_name, ToolConfigSchema())
+        tool_config = self.tools.get(tool_name)
+        if tool_config is None:
+            # Defaults are valid by definition, so skip validation; a fresh
+            # instance keeps callers from sharing the parameters dict
+            tool_config = ToolConfigSchema.model_construct()
+        return tool_config
 
     def set_tool_config(self, tool_name: str, config: ToolConfigSchema) -> None:
         """Set configuration for a specific tool.
@@ -191,9 +199,10 @@ class WorkflowConfigSchema(BaseModel):
     @classmethod
     def validate_progress_format(cls, v: str) -> str:
         """Validate progress format."""
-        valid_formats = ["simple", "detailed", "minimal"]
-        if v not in valid_formats:
-            raise ValueError(f"Invalid progress format. Must be one of: {valid_formats}")
+        if v not in _VALID_PROGRESS_FORMATS:
+            raise ValueError(
+                f"Invalid progress format. Must be one of: {sorted(_VALID_PROGRESS_FORMATS)}"
+            )
         return v
 
 
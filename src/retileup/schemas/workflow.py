@@ -1,10 +1,15 @@
 """Workflow schema definitions for ReTileUp."""
 
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+# Matched by pydantic-core as field constraints
+_STEP_NAME_PATTERN = r'^[a-zA-Z_][a-zA-Z0-9_]*$'
+_VERSION_PATTERN = r'^\d+\.\d+\.\d+$'
 
 
 class StepStatusSchema(str, Enum):
@@ -30,22 +35,32 @@ class ConditionalOperator(str, Enum):
     NOT_EXISTS = "not_exists"
 
 
+# Field types for the values above. Literal fields validate with a single
+# pydantic-core lookup and store plain strings, so the enums remain only as
+# named constants for callers.
+StepStatusLiteral = Literal["pending", "running", "completed", "failed", "skipped"]
+ConditionalOpLiteral = Literal[
+    "eq", "ne", "gt", "ge", "lt", "le", "contains", "not_contains", "exists", "not_exists"
+]
+
+
 class StepConditionSchema(BaseModel):
     """Schema for step execution conditions."""
 
     field: str = Field(..., description="Field to check")
-    operator: ConditionalOperator = Field(..., description="Comparison operator")
+    operator: ConditionalOpLiteral = Field(..., description="Comparison operator")
     value: Optional[Any] = Field(None, description="Value to compare against")
     negate: bool = Field(False, description="Negate the condition result")
 
-    model_config = ConfigDict(use_enum_values=True)
-
 
 class ParameterDefinitionSchema(BaseModel):
     """Schema for parameter definitions."""
 
     name: str = Field(..., description="Parameter name")
-    type: str = Field(..., description="Parameter type")
+    type: Literal[
+        "str", "int", "float", "bool", "list", "dict",
+        "path", "color", "image_format", "percentage",
+    ] = Field(..., description="Parameter type")
     description: Optional[str] = Field(None, description="Parameter description")
     default: Optional[Any] = Field(None, description="Default value")
     required: bool = Field(True, description="Whether parameter is required")
@@ -54,18 +69,6 @@ class ParameterDefinitionSchema(BaseModel):
     max_value: Optional[Union[int, float]] = Field(None, description="Maximum value")
     pattern: Optional[str] = Field(None, description="Regex pattern for string validation")
 
-    @classmethod
-    @field_validator("type")
-    def validate_type(cls, v: str) -> str:
-        """Validate parameter type."""
-        valid_types = [
-            "str", "int", "float", "bool", "list", "dict",
-            "path", "color", "image_format", "percentage"
-        ]
-        if v not in valid_types:
-            raise ValueError(f"Invalid parameter type. Must be one of: {valid_types}")
-        return v
-
 
 class StepInputSchema(BaseModel):
     """Schema for step input configuration."""
@@ -89,8 +92,8 @@ class StepOutputSchema(BaseModel):
 class WorkflowStepSchema(BaseModel):
     """Schema for workflow steps."""
 
-    # Step identification
-    name: str = Field(..., description="Step name")
+    # Step identification (a valid identifier: no spaces or special chars)
+    name: str = Field(..., description="Step name", pattern=_STEP_NAME_PATTERN)
     tool_name: str = Field(..., description="Name of the tool to use")
     description: Optional[str] = Field(None, description="Step description")
 
@@ -125,31 +128,17 @@ class WorkflowStepSchema(BaseModel):
     )
 
     # Runtime state (typically not set in schema, but included for completeness)
-    status: StepStatusSchema = Field(StepStatusSchema.PENDING, description="Current step status")
+    status: StepStatusLiteral = Field("pending", description="Current step status")
     error_message: Optional[str] = Field(None, description="Error message if step failed")
     execution_time: Optional[float] = Field(None, description="Step execution time in seconds")
     started_at: Optional[datetime] = Field(None, description="Step start timestamp")
     completed_at: Optional[datetime] = Field(None, description="Step completion timestamp")
 
-    model_config = ConfigDict(use_enum_values=True)
-
-    @classmethod
-    @field_validator("name")
-    def validate_name(cls, v: str) -> str:
-        """Validate step name."""
-        if not v.strip():
-            raise ValueError("Step name cannot be empty")
-        # Check for valid identifier (no spaces, special chars)
-        import re
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', v):
-            raise ValueError("Step name must be a valid identifier")
-        return v.strip()
-
-    @classmethod
     @field_validator("depends_on")
-    def validate_dependencies(cls, v: List[str], values: Dict[str, Any]) -> List[str]:
+    @classmethod
+    def validate_dependencies(cls, v: List[str], info: ValidationInfo) -> List[str]:
         """Validate step dependencies."""
-        step_name = values.get("name")
+        step_name = info.data.get("name")
         if step_name and step_name in v:
             raise ValueError("Step cannot depend on itself")
         return v
@@ -162,45 +151,31 @@ class WorkflowVariableSchema(BaseModel):
     value: Any = Field(..., description="Variable value")
     type: str = Field("auto", description="Variable type")
     description: Optional[str] = Field(None, description="Variable description")
-    scope: str = Field("workflow", description="Variable scope")
-
-    @classmethod
-    @field_validator("scope")
-    def validate_scope(cls, v: str) -> str:
-        """Validate variable scope."""
-        valid_scopes = ["workflow", "global", "step", "temporary"]
-        if v not in valid_scopes:
-            raise ValueError(f"Invalid scope. Must be one of: {valid_scopes}")
-        return v
+    scope: Literal["workflow", "global", "step", "temporary"] = Field(
+        "workflow", description="Variable scope"
+    )
 
 
 class WorkflowTriggerSchema(BaseModel):
     """Schema for workflow triggers."""
 
-    type: str = Field(..., description="Trigger type")
+    type: Literal["manual", "file_change", "schedule", "webhook", "condition"] = Field(
+        ..., description="Trigger type"
+    )
     condition: Dict[str, Any] = Field(..., description="Trigger condition")
     enabled: bool = Field(True, description="Whether trigger is enabled")
 
-    @classmethod
-    @field_validator("type")
-    def validate_type(cls, v: str) -> str:
-        """Validate trigger type."""
-        valid_types = ["manual", "file_change", "schedule", "webhook", "condition"]
-        if v not in valid_types:
-            raise ValueError(f"Invalid trigger type. Must be one of: {valid_types}")
-        return v
-
 
 class WorkflowSchema(BaseModel):
     """Schema for complete workflows."""
 
     # Workflow identification
     name: str = Field(..., description="Workflow name")
-    version: str = Field("1.0.0", description="Workflow version")
+    version: str = Field("1.0.0", description="Workflow version", pattern=_VERSION_PATTERN)
     description: Optional[str] = Field(None, description="Workflow description")
 
     # Workflow configuration
-    steps: List[WorkflowStepSchema] = Field(..., description="Workflow steps", min_items=1)
+    steps: List[WorkflowStepSchema] = Field(..., description="Workflow steps", min_length=1)
     variables: List[WorkflowVariableSchema] = Field(
         default_factory=list,
         description="Workflow variables"
@@ -237,72 +212,67 @@ class WorkflowSchema(BaseModel):
 
     model_config = ConfigDict(extra="allow")  # Allow additional fields for extensibility
 
-    @classmethod
     @field_validator("name")
+    @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate workflow name."""
         if not v.strip():
             raise ValueError("Workflow name cannot be empty")
         return v.strip()
 
-    @classmethod
-    @field_validator("version")
-    def validate_version(cls, v: str) -> str:
-        """Validate version format."""
-        import re
-        if not re.match(r'^\d+\.\d+\.\d+$', v):
-            raise ValueError("Version must be in format 'x.y.z'")
-        return v
-
-    @classmethod
     @field_validator("steps")
+    @classmethod
     def validate_steps(cls, v: List[WorkflowStepSchema]) -> List[WorkflowStepSchema]:
         """Validate workflow steps."""
         if not v:
             raise ValueError("Workflow must have at least one step")
 
-        # Check for duplicate step names
-        step_names = [step.name for step in v]
-        if len(step_names) != len(set(step_names)):
-            raise ValueError("Workflow steps must have unique names")
-
-        # Validate step dependencies
+        # Check for duplicate step names, stopping at the first one
+        in_degree: Dict[str, int] = {}
+        for step in v:
+            if step.name in in_degree:
+                raise ValueError(
+                    f"Workflow steps must have unique names (duplicate: {step.name!r})"
+                )
+            in_degree[step.name] = 0
+
+        # Validate step dependencies while building the dependency graph
+        dependents: Dict[str, List[str]] = {name: [] for name in in_degree}
         for step in v:
             for dependency in step.depends_on:
-                if dependency not in step_names:
+                if dependency not in dependents:
                     raise ValueError(f"Step '{step.name}' depends on unknown step '{dependency}'")
+                dependents[dependency].append(step.name)
+                in_degree[step.name] += 1
 
-        # Check for circular dependencies (simple check)
-        cls._check_circular_dependencies(v)
+        cls._check_circular_dependencies(in_degree, dependents)
 
         return v
 
     @staticmethod
-    def _check_circular_dependencies(steps: List[WorkflowStepSchema]) -> None:
-        """Check for circular dependencies in workflow steps."""
-        step_deps = {step.name: set(step.depends_on) for step in steps}
-
-        def has_cycle(node: str, visited: set, rec_stack: set) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in step_deps.get(node, set()):
-                if neighbor not in visited:
-                    if has_cycle(neighbor, visited, rec_stack):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        visited = set()
-        rec_stack = set()
-
-        for step_name in step_deps:
-            if step_name not in visited:
-                if has_cycle(step_name, visited, rec_stack):
-                    raise ValueError("Circular dependency detected in workflow steps")
+    def _check_circular_dependencies(
+        in_degree: Dict[str, int], dependents: Dict[str, List[str]]
+    ) -> None:
+        """Check for circular dependencies in workflow steps.
+
+        Args:
+            in_degree: Number of dependencies of each step; consumed
+            dependents: Names of the steps depending on each step
+        """
+        # Kahn's algorithm: repeatedly remove steps with no unresolved
+        # dependencies; any step never removed is part of a cycle
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        processed = 0
+        while ready:
+            name = ready.popleft()
+            processed += 1
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if processed != len(in_degree):
+            raise ValueError("Circular dependency detected in workflow steps")
 
 
 class WorkflowTemplateSchema(BaseModel):
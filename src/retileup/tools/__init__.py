@@ -1,8 +1,23 @@
 """Tools module for ReTileUp image processing tools."""
 
-from .base import BaseTool, ToolConfig, ToolResult
-from .tiling import TilingTool, TilingConfig
-from .batch_renamer import BatchRenamerTool, BatchRenamerConfig
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+if TYPE_CHECKING:
+    from .base import BaseTool, ToolConfig, ToolResult
+    from .batch_renamer import BatchRenamerConfig, BatchRenamerTool
+    from .tiling import TilingConfig, TilingTool
+
+_LAZY_IMPORTS = {
+    "BaseTool": ".base",
+    "ToolConfig": ".base",
+    "ToolResult": ".base",
+    "TilingTool": ".tiling",
+    "TilingConfig": ".tiling",
+    "BatchRenamerTool": ".batch_renamer",
+    "BatchRenamerConfig": ".batch_renamer",
+}
 
 __all__ = [
     "BaseTool",
@@ -12,4 +27,6 @@ __all__ = [
     "TilingConfig",
     "BatchRenamerTool",
     "BatchRenamerConfig"
-]
\ No newline at end of file
+]
+
+__getattr__ = attach(__name__, _LAZY_IMPORTS)
@@ -8,10 +8,15 @@ must implement to ensure consistency and interoperability.
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from ..core.exceptions import ProcessingError, ValidationError
+
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 class ToolResult(BaseModel):
     """Result of tool execution with comprehensive metadata.
@@ -172,6 +177,14 @@ class BaseTool(ABC):
                 return ToolResult(success=True, message="Done")
     """
 
+    # Whether the tool modifies its input image in place. Workflows running
+    # steps in parallel only give such tools a private copy of the image.
+    mutates_input: bool = False
+
+    # Whether instances keep state between executions. Stateless, reentrant
+    # tools may set this to False so a workflow reuses a single instance.
+    stateful: bool = True
+
     def __init__(self) -> None:
         """Initialize the tool.
 
@@ -334,6 +347,53 @@ class BaseTool(ABC):
             if not self._cleanup_called:
                 self.cleanup()
 
+    def validate_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the parameters of a workflow step.
+
+        Called by the workflow orchestrator before process_image(). The
+        default returns the parameters unchanged.
+
+        Args:
+            parameters: Merged global and step parameters
+
+        Returns:
+            Parameters to pass to process_image()
+        """
+        return parameters
+
+    def process_image(
+        self,
+        image: "Image.Image",
+        parameters: Dict[str, Any]
+    ) -> Union["Image.Image", List["Image.Image"]]:
+        """Run the tool as a workflow step.
+
+        The default builds the tool's configuration from the step parameters
+        and runs execute_with_timing(), so file-based tools can be used in
+        workflows as they are. The input image is passed on unchanged. Tools
+        that transform images in memory should override this.
+
+        Args:
+            image: Input image
+            parameters: Validated step parameters
+
+        Returns:
+            The processed image (the input image by default)
+
+        Raises:
+            ValidationError: If the configuration is invalid
+            ProcessingError: If the tool reports a failure
+        """
+        config = self.get_config_schema()(**parameters)
+        errors = self.validate_config(config)
+        if errors:
+            raise ValidationError("; ".join(errors))
+
+        result = self.execute_with_timing(config)
+        if not result.success:
+            raise ProcessingError(result.message, tool_name=self.name)
+        return image
+
     def __str__(self) -> str:
         """String representation of the tool."""
         return f"{self.name} v{self.version}"
@@ -71,6 +71,18 @@ class TestCLIBasics:
         assert "--version" in result.stdout
         assert "--config" in result.stdout
 
+    def test_cli_help_lists_lazy_commands(self, cli_runner):
+        """Test that lazily registered commands appear in help and resolve."""
+        result = cli_runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ("tile", "workflow", "list-tools", "validate", "batch-rename"):
+            assert name in result.stdout
+
+        result = cli_runner.invoke(app, ["tile", "--help"])
+        assert result.exit_code == 0
+        assert "--coords" in result.stdout
+
     def test_cli_version_command(self, cli_runner):
         """Test CLI version command."""
         result = cli_runner.invoke(app, ["--version"])
@@ -111,6 +123,16 @@ class TestCLIConfiguration:
             assert result.exit_code == 0
             # In verbose mode, should show config file usage
 
+    def test_find_config_in_working_directory(self, temp_config_file, monkeypatch):
+        """Test that a retileup.yaml in the working directory is detected."""
+        from retileup.cli.main import _find_config
+
+        monkeypatch.chdir(temp_config_file.parent)
+        found = _find_config(str(temp_config_file.parent))
+
+        assert found is not None
+        assert found.resolve() == temp_config_file.resolve()
+
     def test_explicit_config_file(self, cli_runner, temp_config_file):
         """Test explicit config file specification."""
         result = cli_runner.invoke(app, [
@@ -559,4 +581,158 @@ class TestCLIEdgeCases:
             ])
 
             # Should handle callback errors gracefully
-            assert result.exit_code in [0, 1, 2]
\ No newline at end of file
+            assert result.exit_code in [0, 1, 2]
+
+
+class TestWorkflowCompletion:
+    """Test workflow name auto-completion."""
+
+    def test_complete_workflow_names_prefix(self, temp_dir, monkeypatch):
+        """Test that only workflows sharing the prefix are returned, sorted."""
+        from retileup.cli.commands.workflow import complete_workflow_names
+
+        (temp_dir / "retileup.yaml").write_text(
+            "workflows:\n"
+            "  web-b: {steps: []}\n"
+            "  thumb: {steps: []}\n"
+            "  web-a: {steps: []}\n"
+            "  wex: {steps: []}\n"
+        )
+        monkeypatch.chdir(temp_dir)
+
+        assert complete_workflow_names("web") == ["web-a", "web-b"]
+        assert complete_workflow_names("w") == ["web-a", "web-b", "wex"]
+        assert complete_workflow_names("") == ["thumb", "web-a", "web-b", "wex"]
+        assert complete_workflow_names("x") == []
+
+    def test_complete_workflow_names_picks_up_changes(self, temp_dir, monkeypatch):
+        """Test that an edited config file is re-read."""
+        import os
+
+        from retileup.cli.commands.workflow import complete_workflow_names
+
+        config_file = temp_dir / "retileup.yaml"
+        config_file.write_text("workflows:\n  first: {steps: []}\n")
+        monkeypatch.chdir(temp_dir)
+        assert complete_workflow_names("f") == ["first"]
+
+        config_file.write_text("workflows:\n  fresh: {steps: []}\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert complete_workflow_names("f") == ["fresh"]
+
+    def test_complete_workflow_names_same_mtime_rewrite(self, temp_dir, monkeypatch):
+        """Test that a rewrite keeping the modification time is re-read if the size changed."""
+        import os
+
+        from retileup.cli.commands.workflow import complete_workflow_names
+
+        config_file = temp_dir / "retileup.yaml"
+        config_file.write_text("workflows:\n  first: {steps: []}\n")
+        stat = config_file.stat()
+        monkeypatch.chdir(temp_dir)
+        assert complete_workflow_names("f") == ["first"]
+
+        config_file.write_text("workflows:\n  fresh-start: {steps: []}\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert complete_workflow_names("f") == ["fresh-start"]
+
+
+@pytest.fixture
+def tile_workflow_file(temp_dir):
+    """Create a workflow configuration file with a tiling workflow."""
+    config_file = temp_dir / "workflows.yaml"
+    config_file.write_text(
+        "workflows:\n"
+        "  tiles:\n"
+        "    steps:\n"
+        "      - tool: tile\n"
+        "        config:\n"
+        "          tile_width: 16\n"
+        "          tile_height: 16\n"
+        "          coordinates: [[0, 0], [16, 16]]\n"
+    )
+    return config_file
+
+
+class TestWorkflowCommand:
+    """Test the workflow command."""
+
+    def test_workflow_runs_tools_on_each_file(
+        self, cli_runner, temp_dir, sample_image, tile_workflow_file
+    ):
+        """Test that every input file is run through the workflow's steps."""
+        input_dir = temp_dir / "input"
+        input_dir.mkdir()
+        sample_image.save(input_dir / "first.png")
+        sample_image.save(input_dir / "second.png")
+        output_dir = temp_dir / "output"
+
+        result = cli_runner.invoke(app, [
+            "workflow", "tiles",
+            "--input", str(input_dir),
+            "--output", str(output_dir),
+            "--config", str(tile_workflow_file),
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "Successful: 2 files" in result.output
+        assert sorted(p.name for p in output_dir.iterdir()) == [
+            "first_0_0.png", "first_16_16.png", "second_0_0.png", "second_16_16.png"
+        ]
+
+    def test_workflow_parallel_sets_max_workers(
+        self, cli_runner, temp_dir, sample_image_file, tile_workflow_file, monkeypatch
+    ):
+        """Test that --parallel sizes the orchestrator's worker pool."""
+        from retileup.core import orchestrator as orchestrator_module
+
+        created = []
+
+        class RecordingOrchestrator(orchestrator_module.WorkflowOrchestrator):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(orchestrator_module, "WorkflowOrchestrator", RecordingOrchestrator)
+
+        result = cli_runner.invoke(app, [
+            "workflow", "tiles",
+            "--input", str(sample_image_file),
+            "--output", str(temp_dir / "output"),
+            "--config", str(tile_workflow_file),
+            "--parallel", "2",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert [o.config.performance.max_workers for o in created] == [2]
+
+    def test_workflow_quiet_mode(self, cli_runner, temp_dir, sample_image_file, tile_workflow_file):
+        """Test that quiet mode runs the workflow without progress or summary output."""
+        output_dir = temp_dir / "output"
+
+        result = cli_runner.invoke(app, [
+            "--quiet",
+            "workflow", "tiles",
+            "--input", str(sample_image_file),
+            "--output", str(output_dir),
+            "--config", str(tile_workflow_file),
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "Executing workflow" not in result.output
+        assert "Workflow completed" not in result.output
+        assert sorted(p.name for p in output_dir.iterdir()) == ["sample_0_0.png", "sample_16_16.png"]
+
+    def test_workflow_progress_mode(self, cli_runner, temp_dir, sample_image_file, tile_workflow_file):
+        """Test that the default mode shows progress and a summary."""
+        result = cli_runner.invoke(app, [
+            "workflow", "tiles",
+            "--input", str(sample_image_file),
+            "--output", str(temp_dir / "output"),
+            "--config", str(tile_workflow_file),
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "Executing workflow on 1 files" in result.output
+        assert "Workflow completed" in result.output
@@ -47,6 +47,27 @@ class TestConfig:
         with pytest.raises(FileNotFoundError):
             Config.load_from_file("nonexistent.yaml")
 
+    def test_load_from_file_returns_independent_copies(self, config_file: Path):
+        """Test that cached loads do not share mutable state."""
+        Config.clear_cache()
+        first = Config.load_from_file(config_file)
+        first.set_tool_config("test_tool", {"param1": "changed"})
+
+        second = Config.load_from_file(config_file)
+
+        assert second.tool_configs["test_tool"]["param1"] == "default_value"
+
+    def test_load_from_file_reloads_modified_file(self, config_file: Path):
+        """Test that the file cache is invalidated when the file changes."""
+        Config.clear_cache()
+        assert Config.load_from_file(config_file).performance.max_workers == 2
+
+        config_file.write_text(config_file.read_text().replace("max_workers: 2", "max_workers: 16"))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert Config.load_from_file(config_file).performance.max_workers == 16
+
     def test_save_to_file(self, temp_dir: Path):
         """Test saving configuration to file."""
         config = Config(debug=True)
@@ -62,6 +83,20 @@ class TestConfig:
 
         assert data["debug"] is True
 
+    def test_save_to_file_writes_paths_as_strings(self, temp_dir: Path):
+        """Test that Path values round-trip through the saved YAML."""
+        config = Config(plugin_directories=[Path("plugins")])
+        config_path = temp_dir / "paths_config.yaml"
+
+        config.save_to_file(config_path)
+
+        with open(config_path) as f:
+            data = yaml.safe_load(f)
+
+        assert data["output"]["directory"] == "outputs"
+        assert data["plugin_directories"] == ["plugins"]
+        assert Config.load_from_file(config_path).plugin_directories == [Path("plugins")]
+
     def test_load_from_env(self, monkeypatch):
         """Test loading configuration from environment variables."""
         monkeypatch.setenv("RETILEUP_DEBUG", "true")
@@ -74,6 +109,59 @@ class TestConfig:
         assert config.logging.level == "DEBUG"
         assert config.performance.max_workers == 8
 
+    def test_load_from_env_output_settings(self, monkeypatch):
+        """Test loading output settings and skipping empty variables."""
+        monkeypatch.setenv("RETILEUP_OUTPUT_DIR", "/tmp/retileup-out")
+        monkeypatch.setenv("RETILEUP_OUTPUT_QUALITY", "70")
+        monkeypatch.setenv("RETILEUP_OVERWRITE", "Yes")
+        monkeypatch.setenv("RETILEUP_MEMORY_LIMIT", "")
+
+        config = Config.load_from_env()
+
+        assert config.output.directory == Path("/tmp/retileup-out")
+        assert config.output.quality == 70
+        assert config.output.overwrite is True
+        assert config.performance.memory_limit is None
+
+    @pytest.mark.parametrize("value,expected", [("On", True), ("1", True), ("off", False)])
+    def test_load_from_env_boolean_values(self, monkeypatch, value, expected):
+        """Test boolean parsing of environment flags."""
+        monkeypatch.setenv("RETILEUP_DEBUG", value)
+
+        assert Config.load_from_env().debug is expected
+
+    def test_load_config_without_environment(self, monkeypatch):
+        """Test that load_config falls back to defaults with no overrides."""
+        for key in list(os.environ):
+            if key.startswith("RETILEUP_"):
+                monkeypatch.delenv(key)
+
+        assert Config.load_config() == Config()
+
+    def test_load_config_uses_environment(self, monkeypatch):
+        """Test that any environment override is honoured by load_config."""
+        monkeypatch.setenv("RETILEUP_MAX_WORKERS", "6")
+
+        config = Config.load_config()
+
+        assert config.performance.max_workers == 6
+
+    def test_section_settings_are_assignable(self):
+        """Test that section models can be updated in place and are not shared."""
+        config = Config()
+        config.logging.level = "DEBUG"
+        config.performance.max_workers = 8
+        config.output.quality = 90
+
+        assert config.logging.level == "DEBUG"
+        assert config.performance.max_workers == 8
+        assert config.output.quality == 90
+
+        fresh = Config.load_default()
+        assert fresh.logging.level == "INFO"
+        assert fresh.performance.max_workers == 4
+        assert fresh.output.quality == 95
+
     def test_get_tool_config(self):
         """Test getting tool-specific configuration."""
         config = Config()
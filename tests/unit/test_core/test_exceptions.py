@@ -209,7 +209,15 @@ class TestValidationError:
         assert error.field_name == "width"
         assert error.invalid_value == -10
         assert error.context["field_name"] == "width"
-        assert error.context["invalid_value"] == "-10"
+        assert error.context["invalid_value"] == -10
+
+    def test_validation_error_to_dict_stringifies_invalid_value(self):
+        """Test that non-primitive invalid values are stringified on serialization."""
+        error = ValidationError("Invalid size", invalid_value=(10, -10))
+
+        assert error.context["invalid_value"] == (10, -10)
+        assert error.to_dict()["context"]["invalid_value"] == "(10, -10)"
+        assert ValidationError("Invalid width", invalid_value=-10).to_dict()["context"]["invalid_value"] == -10
 
     def test_validation_error_custom_error_code(self):
         """Test ValidationError with custom error code."""
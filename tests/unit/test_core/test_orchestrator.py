@@ -0,0 +1,330 @@
+"""Unit tests for the WorkflowOrchestrator."""
+
+import asyncio
+from typing import Any, Dict, List, Type
+
+import pytest
+from PIL import Image
+
+from retileup.core.config import Config, PerformanceConfig
+from retileup.core.orchestrator import WorkflowOrchestrator
+from retileup.core.registry import ToolRegistry
+from retileup.core.workflow import StepStatus, Workflow, WorkflowStep
+from retileup.tools.base import BaseTool, ToolConfig, ToolResult
+
+
+class RecordingTool(BaseTool):
+    """Mock tool that records the parameters it was given."""
+
+    calls: List[Dict[str, Any]] = []
+
+    @property
+    def name(self) -> str:
+        return "recording-tool"
+
+    @property
+    def description(self) -> str:
+        return "Records the parameters passed to it"
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    def get_config_schema(self) -> Type[ToolConfig]:
+        return ToolConfig
+
+    def validate_config(self, config: ToolConfig) -> List[str]:
+        return []
+
+    def execute(self, config: ToolConfig) -> ToolResult:
+        return ToolResult(success=True, message="Done")
+
+    def validate_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        parameters["validated"] = True
+        return parameters
+
+    def process_image(self, image: Image.Image, parameters: Dict[str, Any]) -> Image.Image:
+        RecordingTool.calls.append(parameters)
+        if parameters.get("fail"):
+            raise ValueError("Requested failure")
+        return image
+
+
+class AsyncRecordingTool(RecordingTool):
+    """Mock tool providing a coroutine for processing."""
+
+    @property
+    def name(self) -> str:
+        return "async-recording-tool"
+
+    def process_image(self, image: Image.Image, parameters: Dict[str, Any]) -> Image.Image:
+        raise AssertionError("The coroutine should be used instead")
+
+    async def process_image_async(self, image: Image.Image, parameters: Dict[str, Any]) -> Image.Image:
+        await asyncio.sleep(0)
+        RecordingTool.calls.append(parameters)
+        return image
+
+
+class MutatingTool(RecordingTool):
+    """Mock tool that draws on its input image."""
+
+    mutates_input = True
+
+    @property
+    def name(self) -> str:
+        return "mutating-tool"
+
+    def process_image(self, image: Image.Image, parameters: Dict[str, Any]) -> Image.Image:
+        image.putpixel((0, 0), (0, 0, 255))
+        return image
+
+
+class StatelessTool(RecordingTool):
+    """Mock tool that can be reused across steps and records its instances."""
+
+    stateful = False
+    instances: List[BaseTool] = []
+
+    def __init__(self) -> None:
+        super().__init__()
+        StatelessTool.instances.append(self)
+
+    @property
+    def name(self) -> str:
+        return "stateless-tool"
+
+
+class ReplacementStatelessTool(StatelessTool):
+    """Mock tool registered over StatelessTool's name."""
+
+
+@pytest.fixture
+def orchestrator():
+    """Create an orchestrator with the recording tools registered."""
+    RecordingTool.calls = []
+    StatelessTool.instances = []
+    registry = ToolRegistry()
+    registry.register_tool(RecordingTool)
+    registry.register_tool(AsyncRecordingTool)
+    registry.register_tool(MutatingTool)
+    registry.register_tool(StatelessTool)
+    orchestrator = WorkflowOrchestrator(registry)
+    yield orchestrator
+    orchestrator.cleanup()
+
+
+class TestWorkflowOrchestrator:
+    """Test cases for the WorkflowOrchestrator class."""
+
+    def test_step_parameters_override_global_parameters(self, orchestrator, sample_image):
+        """Test that step parameters are merged over global parameters."""
+        step = WorkflowStep(name="step", tool_name="recording-tool", parameters={"size": 2})
+
+        result = orchestrator.execute_step(step, sample_image, {"size": 1, "mode": "fast"})
+
+        assert result.success
+        assert RecordingTool.calls == [{"size": 2, "mode": "fast", "validated": True}]
+
+    def test_step_parameters_are_not_modified(self, orchestrator, sample_image):
+        """Test that tools receive a copy of the step parameters."""
+        step = WorkflowStep(name="step", tool_name="recording-tool", parameters={"size": 2})
+
+        orchestrator.execute_step(step, sample_image)
+
+        assert step.parameters == {"size": 2}
+
+    def test_missing_tool_fails_step(self, orchestrator, sample_image):
+        """Test that an unknown tool produces a failed result."""
+        step = WorkflowStep(name="step", tool_name="missing-tool")
+
+        result = orchestrator.execute_step(step, sample_image)
+
+        assert not result.success
+        assert step.status == StepStatus.FAILED
+        assert "missing-tool" in step.error_message
+
+    def test_sequential_stop_on_error_skips_remaining_steps(self, orchestrator, sample_image):
+        """Test that remaining enabled steps are skipped after a failure."""
+        workflow = Workflow(name="workflow", steps=[
+            WorkflowStep(name="first", tool_name="recording-tool"),
+            WorkflowStep(name="second", tool_name="recording-tool", parameters={"fail": True}),
+            WorkflowStep(name="third", tool_name="recording-tool"),
+        ])
+
+        results = orchestrator.execute_workflow_sequential(workflow, sample_image)
+
+        assert [r.success for r in results] == [True, False]
+        assert workflow.steps[2].status == StepStatus.SKIPPED
+
+    def test_parallel_results_follow_step_order(self, orchestrator, sample_image):
+        """Test that parallel results are returned in step order."""
+        workflow = Workflow(name="workflow", parallel_execution=True, steps=[
+            WorkflowStep(name=f"step-{i}", tool_name="recording-tool") for i in range(5)
+        ])
+
+        results = orchestrator.execute_workflow_parallel(workflow, sample_image)
+
+        assert [r.step.name for r in results] == [f"step-{i}" for i in range(5)]
+        assert all(r.success for r in results)
+
+    def test_sequential_runs_steps_after_their_dependencies(self, orchestrator, sample_image):
+        """Test that a step listed before its dependency runs after it."""
+        workflow = Workflow(name="workflow", steps=[
+            WorkflowStep(
+                name="tile", tool_name="recording-tool",
+                parameters={"step": "tile"}, depends_on=["load"]
+            ),
+            WorkflowStep(name="load", tool_name="recording-tool", parameters={"step": "load"}),
+        ])
+
+        results = orchestrator.execute_workflow_sequential(workflow, sample_image)
+
+        assert [r.step.name for r in results] == ["load", "tile"]
+        assert [call["step"] for call in RecordingTool.calls] == ["load", "tile"]
+
+    def test_steps_with_failed_dependencies_are_skipped(self, orchestrator, sample_image):
+        """Test that dependents of a failed step are skipped when execution continues."""
+        workflow = Workflow(name="workflow", stop_on_error=False, steps=[
+            WorkflowStep(name="load", tool_name="recording-tool", parameters={"fail": True}),
+            WorkflowStep(name="tile", tool_name="recording-tool", depends_on=["load"]),
+            WorkflowStep(name="report", tool_name="recording-tool"),
+        ])
+
+        results = orchestrator.execute_workflow_sequential(workflow, sample_image)
+
+        assert [(r.step.name, r.success) for r in results] == [("load", False), ("report", True)]
+        assert workflow.get_step("tile").status == StepStatus.SKIPPED
+
+    def test_parallel_runs_dependency_layers_in_order(self, orchestrator, sample_image):
+        """Test that parallel steps only start once their dependencies have finished."""
+        workflow = Workflow(name="workflow", parallel_execution=True, steps=[
+            WorkflowStep(
+                name="export", tool_name="recording-tool",
+                parameters={"step": "export"}, depends_on=["tile", "thumb"]
+            ),
+            WorkflowStep(
+                name="tile", tool_name="recording-tool",
+                parameters={"step": "tile"}, depends_on=["load"]
+            ),
+            WorkflowStep(
+                name="thumb", tool_name="recording-tool",
+                parameters={"step": "thumb"}, depends_on=["load"]
+            ),
+            WorkflowStep(name="load", tool_name="recording-tool", parameters={"step": "load"}),
+        ])
+
+        results = orchestrator.execute_workflow_parallel(workflow, sample_image)
+
+        assert [r.step.name for r in results] == ["load", "tile", "thumb", "export"]
+        order = [call["step"] for call in RecordingTool.calls]
+        assert order[0] == "load"
+        assert sorted(order[1:3]) == ["thumb", "tile"]
+        assert order[3] == "export"
+
+    def test_parallel_async_runs_dependency_layers_in_order(self, orchestrator, sample_image):
+        """Test that the async parallel path also runs dependency layers in order."""
+        workflow = Workflow(name="workflow", parallel_execution=True, steps=[
+            WorkflowStep(
+                name="tile", tool_name="async-recording-tool",
+                parameters={"step": "tile"}, depends_on=["load"]
+            ),
+            WorkflowStep(name="load", tool_name="async-recording-tool", parameters={"step": "load"}),
+        ])
+
+        results = asyncio.run(orchestrator.execute_workflow_async(workflow, sample_image, validate=False))
+
+        assert [r.step.name for r in results] == ["load", "tile"]
+        assert [call["step"] for call in RecordingTool.calls] == ["load", "tile"]
+
+    def test_parallel_copies_image_only_for_mutating_tools(self, orchestrator, sample_image):
+        """Test that only tools that mutate their input receive a copy of the image."""
+        original = sample_image.tobytes()
+        workflow = Workflow(name="workflow", parallel_execution=True, steps=[
+            WorkflowStep(name="mutating", tool_name="mutating-tool"),
+            WorkflowStep(name="reading", tool_name="recording-tool"),
+        ])
+
+        results = orchestrator.execute_workflow_parallel(workflow, sample_image)
+
+        assert all(r.success for r in results)
+        assert results[0].result is not sample_image
+        assert results[0].result.getpixel((0, 0)) == (0, 0, 255)
+        assert sample_image.tobytes() == original
+        assert results[1].result is sample_image
+
+    def test_stateless_tool_instance_is_reused(self, orchestrator, sample_image):
+        """Test that steps using a stateless tool share one instance."""
+        StatelessTool.instances = []  # Registration creates an instance of its own
+        workflow = Workflow(name="workflow", steps=[
+            WorkflowStep(name=f"step-{i}", tool_name="stateless-tool") for i in range(3)
+        ])
+
+        results = orchestrator.execute_workflow_sequential(workflow, sample_image)
+
+        assert all(r.success for r in results)
+        assert len(StatelessTool.instances) == 1
+
+    def test_reregistering_tool_invalidates_cached_instance(self, orchestrator):
+        """Test that a tool registered again under the same name is not served from the cache."""
+        cached = orchestrator._get_tool("stateless-tool")
+
+        orchestrator.registry.register_tool(
+            ReplacementStatelessTool, name="stateless-tool", force=True
+        )
+        tool = orchestrator._get_tool("stateless-tool")
+
+        assert type(cached) is StatelessTool
+        assert type(tool) is ReplacementStatelessTool
+        assert orchestrator._get_tool("stateless-tool") is tool
+
+    def test_cleanup_clears_tool_cache(self, orchestrator):
+        """Test that cleanup drops cached tool instances."""
+        cached = orchestrator._get_tool("stateless-tool")
+
+        orchestrator.cleanup()
+
+        assert orchestrator._get_tool("stateless-tool") is not cached
+
+    def test_parallel_with_single_worker_runs_inline(self, sample_image):
+        """Test that a single-worker configuration does not start a thread pool."""
+        registry = ToolRegistry()
+        registry.register_tool(RecordingTool)
+        orchestrator = WorkflowOrchestrator(
+            registry, Config(performance=PerformanceConfig(max_workers=1))
+        )
+        workflow = Workflow(name="workflow", parallel_execution=True, steps=[
+            WorkflowStep(name=f"step-{i}", tool_name="recording-tool") for i in range(3)
+        ])
+
+        results = orchestrator.execute_workflow_parallel(workflow, sample_image)
+
+        assert [r.step.name for r in results] == ["step-0", "step-1", "step-2"]
+        assert all(r.result is sample_image for r in results)
+        assert orchestrator._executor is None
+
+    def test_execute_workflow_async_with_sync_tools(self, orchestrator, sample_image):
+        """Test that tools without a coroutine run from the async entry point."""
+        workflow = Workflow(name="workflow", steps=[
+            WorkflowStep(name="first", tool_name="recording-tool"),
+            WorkflowStep(name="second", tool_name="recording-tool", parameters={"fail": True}),
+            WorkflowStep(name="third", tool_name="recording-tool"),
+        ])
+
+        results = asyncio.run(orchestrator.execute_workflow_async(workflow, sample_image, validate=False))
+
+        assert [r.success for r in results] == [True, False]
+        assert workflow.steps[2].status == StepStatus.SKIPPED
+
+    def test_execute_workflow_async_awaits_async_tools(self, orchestrator, sample_image):
+        """Test that tools providing a coroutine are awaited concurrently."""
+        workflow = Workflow(name="workflow", parallel_execution=True, steps=[
+            WorkflowStep(name=f"step-{i}", tool_name="async-recording-tool", parameters={"index": i})
+            for i in range(3)
+        ])
+
+        results = asyncio.run(orchestrator.execute_workflow_async(workflow, sample_image, validate=False))
+
+        assert [r.step.name for r in results] == ["step-0", "step-1", "step-2"]
+        assert all(r.success for r in results)
+        assert sorted(call["index"] for call in RecordingTool.calls) == [0, 1, 2]
@@ -10,9 +10,11 @@ This module tests the tool registry system including:
 """
 
 import importlib.util
+import os
 import tempfile
 import threading
 import time
+from enum import Enum
 from pathlib import Path
 from typing import List, Type
 from unittest.mock import Mock, patch, MagicMock
@@ -162,6 +164,24 @@ class TestToolRegistry:
         assert "mock-valid-tool" not in registry
         assert registry.get_tool_class("custom-tool-name") == MockValidTool
 
+    def test_tool_registration_with_str_enum_name(self):
+        """Test registering a tool whose name is a str subclass."""
+        class ToolName(str, Enum):
+            ENUM_TOOL = "enum-tool"
+
+        class EnumNamedTool(MockValidTool):
+            @property
+            def name(self) -> str:
+                return ToolName.ENUM_TOOL
+
+        registry = ToolRegistry()
+
+        registry.register_tool(EnumNamedTool)
+
+        assert "enum-tool" in registry
+        assert type(registry.list_tools()[0]) is str
+        assert registry.get_tool_class("enum-tool") == EnumNamedTool
+
     def test_tool_registration_duplicate_without_force(self):
         """Test duplicate tool registration without force flag."""
         registry = ToolRegistry()
@@ -191,6 +211,7 @@ class TestToolRegistry:
 
         assert "must inherit from BaseTool" in str(exc_info.value)
         assert exc_info.value.error_code == ErrorCode.TOOL_REGISTRATION_ERROR
+        assert exc_info.value.context["tool_name"] == "MockInvalidTool"
 
     def test_tool_registration_abstract_base_class(self):
         """Test registration of abstract BaseTool class."""
@@ -210,6 +231,21 @@ class TestToolRegistry:
 
         assert "must have valid description property" in str(exc_info.value)
 
+    def test_tool_registration_instantiates_once(self):
+        """Test that registration validates and reads metadata from one instance."""
+        registry = ToolRegistry()
+        instances = []
+
+        class CountingTool(MockValidTool):
+            def __init__(self):
+                super().__init__()
+                instances.append(self)
+
+        registry.register_tool(CountingTool, plugin_path=Path("/plugins/counting.py"))
+
+        assert len(instances) == 1
+        assert registry.get_tool_metadata("mock-valid-tool")["plugin_path"] == str(Path("/plugins/counting.py"))
+
     def test_tool_unregistration(self):
         """Test tool unregistration."""
         registry = ToolRegistry()
@@ -245,6 +281,19 @@ class TestToolRegistry:
         registry.get_tool_class("mock-valid-tool")
         assert metadata.usage_count == 2
 
+    def test_get_tool_class_without_usage_tracking(self):
+        """Test that untracked lookups leave usage statistics unchanged."""
+        registry = ToolRegistry()
+        registry.register_tool(MockValidTool)
+
+        tool_class = registry.get_tool_class("mock-valid-tool", track_usage=False)
+
+        metadata = registry._tools["mock-valid-tool"]
+        assert tool_class == MockValidTool
+        assert tool_class.mutates_input is False
+        assert metadata.usage_count == 0
+        assert metadata.last_used is None
+
     def test_get_tool_class_nonexistent(self):
         """Test getting non-existent tool class."""
         registry = ToolRegistry()
@@ -335,6 +384,20 @@ class TestToolRegistry:
         assert len(tools_with_metadata) == 1
         assert tools_with_metadata[0]["name"] == "mock-valid-tool"
 
+    def test_iteration_is_unaffected_by_registration(self):
+        """Test that iterating the registry sees a stable snapshot of tools."""
+        registry = ToolRegistry()
+        registry.register_tool(MockValidTool)
+
+        seen = []
+        for name in registry:
+            seen.append(name)
+            registry.register_tool(MockValidTool, name="another-tool")
+            registry.unregister_tool("mock-valid-tool")
+
+        assert seen == ["mock-valid-tool"]
+        assert registry.list_tools() == ["another-tool"]
+
     def test_list_tools_by_pattern(self):
         """Test listing tools by pattern matching."""
         registry = ToolRegistry()
@@ -516,6 +579,53 @@ class TestPlugin(BaseTool):
         assert loaded_count == 1
         assert "test-plugin" in registry
 
+    def test_load_plugins_ignores_imported_tools(self, temp_dir):
+        """Test that tools imported into a plugin are not registered from it."""
+        registry = ToolRegistry()
+
+        plugin_dir = temp_dir / "plugins"
+        plugin_dir.mkdir()
+        (plugin_dir / "reexport_plugin.py").write_text(
+            "from retileup.tools.tiling import TilingTool\n"
+        )
+
+        assert registry.load_plugins_from_directory(plugin_dir) == 0
+        assert len(registry) == 0
+
+    def test_load_plugins_uses_explicit_tool_list(self, temp_dir):
+        """Test that __retileup_tools__ selects the tools a plugin provides."""
+        registry = ToolRegistry()
+
+        plugin_dir = temp_dir / "plugins"
+        plugin_dir.mkdir()
+        (plugin_dir / "explicit_plugin.py").write_text(
+            "from retileup.tools.tiling import TilingTool\n"
+            "__retileup_tools__ = (TilingTool,)\n"
+        )
+
+        assert registry.load_plugins_from_directory(plugin_dir) == 1
+        assert "tile" in registry
+
+    def test_load_plugins_reuses_unchanged_files(self, temp_dir):
+        """Test that rescanning only re-imports plugin files that changed."""
+        registry = ToolRegistry()
+
+        plugin_dir = temp_dir / "plugins"
+        plugin_dir.mkdir()
+        marker = temp_dir / "imports.log"
+
+        plugin_file = plugin_dir / "counted_plugin.py"
+        plugin_file.write_text(f"open({str(marker)!r}, 'a').write('x')\n")
+
+        registry.load_plugins_from_directory(plugin_dir)
+        registry.load_plugins_from_directory(plugin_dir)
+        assert marker.read_text() == "x"
+
+        stat = plugin_file.stat()
+        os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        registry.load_plugins_from_directory(plugin_dir)
+        assert marker.read_text() == "xx"
+
     def test_load_plugins_from_nonexistent_directory(self, temp_dir):
         """Test loading plugins from non-existent directory."""
         registry = ToolRegistry()
@@ -525,6 +635,16 @@ class TestPlugin(BaseTool):
 
         assert loaded_count == 0
 
+    def test_load_plugins_from_unreadable_directory(self, temp_dir, caplog):
+        """Test that an unreadable plugin directory is logged and skipped."""
+        registry = ToolRegistry()
+
+        with patch("retileup.core.registry.os.scandir", side_effect=PermissionError("denied")):
+            loaded_count = registry.load_plugins_from_directory(temp_dir)
+
+        assert loaded_count == 0
+        assert "denied" in caplog.text
+
     def test_load_plugins_skip_private_files(self, temp_dir):
         """Test that private files are skipped during plugin loading."""
         registry = ToolRegistry()
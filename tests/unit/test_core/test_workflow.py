@@ -0,0 +1,112 @@
+"""Unit tests for the Workflow module."""
+
+import json
+
+import pytest
+
+from retileup.core.workflow import StepStatus, Workflow, WorkflowStep
+
+
+class TestWorkflow:
+    """Test cases for the Workflow class."""
+
+    def test_from_dict_round_trip(self, sample_workflow):
+        """Test that a serialized workflow loads back with validation."""
+        workflow = Workflow.from_dict(sample_workflow.to_dict())
+
+        assert workflow == sample_workflow
+
+    def test_from_dict_trusted_round_trip(self, sample_workflow):
+        """Test that trusted loads rebuild the same workflow without validation."""
+        sample_workflow.steps[0].status = StepStatus.COMPLETED
+
+        workflow = Workflow.from_dict(sample_workflow.to_dict(), trusted=True)
+
+        assert workflow.to_dict() == sample_workflow.to_dict()
+        assert isinstance(workflow.steps[0], WorkflowStep)
+        assert workflow.get_step("step2").parameters == {"param2": "value2"}
+
+    def test_from_json_round_trip(self, sample_workflow):
+        """Test loading a workflow from its JSON form."""
+        workflow = Workflow.from_json(json.dumps(sample_workflow.to_dict()))
+
+        assert workflow == sample_workflow
+
+    def test_from_dict_validates_untrusted_data(self):
+        """Test that untrusted data is still validated."""
+        with pytest.raises(ValueError):
+            Workflow.from_dict({"name": " ", "steps": [{"name": "a", "tool_name": "t"}]})
+
+    def test_duplicate_step_names_are_rejected(self):
+        """Test that the duplicated step name is reported."""
+        with pytest.raises(ValueError, match="duplicate: 'resize'"):
+            Workflow(name="workflow", steps=[
+                WorkflowStep(name="resize", tool_name="t"),
+                WorkflowStep(name="tile", tool_name="t"),
+                WorkflowStep(name="resize", tool_name="t"),
+            ])
+
+    def test_execution_summary(self, sample_workflow):
+        """Test summary counts for steps with enum and plain status values."""
+        sample_workflow.add_step(name="step3", tool_name="test_tool")
+        sample_workflow.steps[0].status = StepStatus.COMPLETED
+        sample_workflow.steps[0].execution_time = 1.5
+        sample_workflow.steps[1].status = "failed"
+        sample_workflow.steps[1].execution_time = 0.5
+
+        summary = sample_workflow.get_execution_summary()
+
+        assert summary["total_steps"] == 3
+        assert summary["completed_steps"] == 1
+        assert summary["failed_steps"] == 1
+        assert summary["skipped_steps"] == 0
+        assert summary["success_rate"] == pytest.approx(1 / 3)
+        assert summary["total_execution_time"] == 2.0
+
+    def test_topological_layers(self):
+        """Test that independent steps share a layer and dependents follow."""
+        workflow = Workflow(name="dag", steps=[
+            WorkflowStep(name="load", tool_name="t"),
+            WorkflowStep(name="tile", tool_name="t", depends_on=["load"]),
+            WorkflowStep(name="thumb", tool_name="t", depends_on=["load"]),
+            WorkflowStep(name="export", tool_name="t", depends_on=["tile", "thumb"]),
+            WorkflowStep(name="report", tool_name="t"),
+        ])
+
+        layers = [[step.name for step in layer] for layer in workflow.topological_layers()]
+
+        assert layers == [["load", "report"], ["tile", "thumb"], ["export"]]
+
+    def test_topological_layers_detects_cycles(self):
+        """Test that circular dependencies are rejected."""
+        workflow = Workflow(name="dag", steps=[
+            WorkflowStep(name="a", tool_name="t", depends_on=["b"]),
+            WorkflowStep(name="b", tool_name="t", depends_on=["a"]),
+        ])
+
+        with pytest.raises(ValueError, match="Circular dependency"):
+            workflow.topological_layers()
+
+    def test_validate_workflow_reports_dependency_errors(self, tool_registry):
+        """Test that unknown dependencies are reported as validation errors."""
+        workflow = Workflow(name="dag", steps=[
+            WorkflowStep(name="a", tool_name="t", depends_on=["missing"]),
+        ])
+
+        errors = workflow.validate_workflow(tool_registry)
+
+        assert any("unknown step 'missing'" in error for error in errors)
+
+    def test_iter_ready_steps(self):
+        """Test that only pending steps with completed dependencies are ready."""
+        workflow = Workflow(name="dag", steps=[
+            WorkflowStep(name="load", tool_name="t"),
+            WorkflowStep(name="tile", tool_name="t", depends_on=["load"]),
+            WorkflowStep(name="report", tool_name="t", enabled=False),
+        ])
+
+        assert [step.name for step in workflow.iter_ready_steps()] == ["load"]
+
+        workflow.steps[0].status = StepStatus.COMPLETED
+
+        assert [step.name for step in workflow.iter_ready_steps()] == ["tile"]
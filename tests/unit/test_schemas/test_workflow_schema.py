@@ -0,0 +1,85 @@
+"""Unit tests for the workflow schema definitions."""
+
+import pytest
+from pydantic import ValidationError
+
+from retileup.schemas.workflow import (
+    StepStatusSchema,
+    WorkflowSchema,
+    WorkflowStepSchema,
+    WorkflowTriggerSchema,
+    WorkflowVariableSchema,
+)
+
+
+def _steps(*steps):
+    """Build step dictionaries from (name, depends_on) pairs."""
+    return [{"name": name, "tool_name": "tile", "depends_on": list(deps)} for name, deps in steps]
+
+
+class TestWorkflowStepSchema:
+    """Test cases for the WorkflowStepSchema class."""
+
+    def test_step_name_must_be_identifier(self):
+        """Test that step names with spaces or symbols are rejected."""
+        with pytest.raises(ValidationError):
+            WorkflowStepSchema(name="bad name", tool_name="tile")
+
+    def test_step_cannot_depend_on_itself(self):
+        """Test that self-dependencies are rejected."""
+        with pytest.raises(ValidationError, match="cannot depend on itself"):
+            WorkflowStepSchema(name="tile_step", tool_name="tile", depends_on=["tile_step"])
+
+    def test_status_accepts_enum_members(self):
+        """Test that enum members are stored as their string values."""
+        step = WorkflowStepSchema(name="step", tool_name="tile", status=StepStatusSchema.FAILED)
+
+        assert step.status == "failed"
+        assert type(step.status) is str
+
+
+class TestWorkflowSchema:
+    """Test cases for the WorkflowSchema class."""
+
+    def test_valid_workflow(self):
+        """Test that a valid workflow passes validation."""
+        workflow = WorkflowSchema(
+            name=" pipeline ",
+            steps=_steps(("load", ()), ("tile", ("load",)), ("export", ("load", "tile"))),
+        )
+
+        assert workflow.name == "pipeline"
+        assert [step.name for step in workflow.steps] == ["load", "tile", "export"]
+
+    def test_invalid_version(self):
+        """Test that versions must be in x.y.z format."""
+        with pytest.raises(ValidationError):
+            WorkflowSchema(name="pipeline", version="1.0", steps=_steps(("load", ())))
+
+    def test_duplicate_step_names(self):
+        """Test that duplicate step names are reported."""
+        with pytest.raises(ValidationError, match="duplicate: 'load'"):
+            WorkflowSchema(name="pipeline", steps=_steps(("load", ()), ("load", ())))
+
+    def test_unknown_dependency(self):
+        """Test that dependencies on unknown steps are rejected."""
+        with pytest.raises(ValidationError, match="unknown step 'missing'"):
+            WorkflowSchema(name="pipeline", steps=_steps(("load", ("missing",))))
+
+    def test_circular_dependency(self):
+        """Test that dependency cycles are rejected."""
+        with pytest.raises(ValidationError, match="Circular dependency"):
+            WorkflowSchema(
+                name="pipeline",
+                steps=_steps(("a", ("c",)), ("b", ("a",)), ("c", ("b",)), ("d", ())),
+            )
+
+    def test_choice_fields(self):
+        """Test that scope and trigger type only accept known values."""
+        with pytest.raises(ValidationError):
+            WorkflowVariableSchema(name="size", value=1, scope="session")
+
+        with pytest.raises(ValidationError):
+            WorkflowTriggerSchema(type="cron", condition={})
+
+        assert WorkflowVariableSchema(name="size", value=1).scope == "workflow"